@@ -1,3 +1,27 @@
+import atexit
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# One pool for everything threaded in this package (agent dispatch, stderr
+# draining): amortizes thread startup and bounds concurrent subprocess load
+# instead of spawning ad-hoc threads per call.
+_POOL = ThreadPoolExecutor(max_workers=6, thread_name_prefix="agent")
+atexit.register(_POOL.shutdown, wait=False)
+
+
+def get_pool() -> ThreadPoolExecutor:
+    """Shared executor used by run_async and subprocess stderr draining."""
+    return _POOL
+
+
+@lru_cache(maxsize=32)
+def which(binary: str) -> "str | None":
+    """Memoized shutil.which — PATH rarely changes mid-process, and the
+    uncached version stats every PATH directory on each lookup."""
+    return shutil.which(binary)
+
+
 from .creator_agent import CreatorAgent
 from .reviewer_agent import ReviewerAgent
 from .critic_agent import CriticAgent
@@ -10,10 +34,17 @@ TOOL_MAP = {
 }
 
 
-def create_agents(creator_key: str, reviewer_key: str, critic_key: str, timeout: int, display):
+def create_agents(creator_key: str, reviewer_key: str, critic_key: str, timeout: int, display,
+                  use_cache: bool = True):
     """Instantiate the three role agents from user-facing key names (claude/openai/gemini)."""
-    return (
-        CreatorAgent(cli=TOOL_MAP[creator_key],  timeout=timeout, display=display),
-        ReviewerAgent(cli=TOOL_MAP[reviewer_key], timeout=timeout, display=display),
-        CriticAgent(cli=TOOL_MAP[critic_key],    timeout=timeout, display=display),
-    )
+    creator = CreatorAgent(cli=TOOL_MAP[creator_key], timeout=timeout, display=display)
+    reviewer = ReviewerAgent(cli=TOOL_MAP[reviewer_key], timeout=timeout, display=display)
+    critic = CriticAgent(cli=TOOL_MAP[critic_key], timeout=timeout, display=display)
+    # A cache hit replays captured stdout only. That is the whole product
+    # for the Reviewer and Critic, but the Creator's real output is the
+    # files it writes into the workspace — a hit would skip the CLI and
+    # leave solution.py untouched while the loop appeared to run. The
+    # Creator therefore never serves from cache (see CreatorAgent.__init__).
+    reviewer.use_cache = use_cache
+    critic.use_cache = use_cache
+    return creator, reviewer, critic
@@ -5,11 +5,30 @@ Abstract base class for all agents.
 Each agent wraps a specific CLI tool and exposes a single run(prompt) method.
 """
 
+import asyncio
 import os
-import shutil
+import random
+import re
+import signal
 import subprocess
+import sys
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, field
+from typing import Iterator
+
+# Resumed sessions reuse the backend's KV cache (no re-prefill of the system
+# prompt and prior turns), but the context grows every turn — start fresh
+# after this many turns to keep it bounded.
+_SESSION_RESET_TURNS = 50
+
+# Base delay for transient-failure retries; actual delays follow the
+# Fibonacci sequence (0.5, 0.5, 1, 1.5, 2.5s ...) plus jitter.
+_RETRY_BASE_DELAY = 0.5
 
 
 _FALLBACK_TRIGGERS = frozenset([
@@ -25,6 +44,13 @@ _FALLBACK_TRIGGERS = frozenset([
     "context window",
 ])
 
+# Compiled once: a single case-insensitive multi-pattern scan over the raw
+# output beats N separate `in raw.lower()` passes (and skips the full
+# lowercased copy) on multi-KB CLI responses.
+_FALLBACK_RE = re.compile(
+    "|".join(re.escape(t) for t in sorted(_FALLBACK_TRIGGERS)), re.IGNORECASE
+)
+
 
 class AgentError(Exception):
     """Raised when an agent call fails irrecoverably."""
@@ -65,13 +91,30 @@ class BaseAgent(ABC):
     ROLE: str = "Agent"
     COLOR: str = "white"
 
-    def __init__(self, cli: str, timeout: int, display):
-        self.cli = cli
+    def __init__(self, cli: str, timeout: int, display, max_retries: int = 2):
+        # Interned: the cli name is compared against literals in every
+        # parse_output dispatch and hashed on every _COMMANDS lookup, so
+        # identity-equality lets those short-circuit to pointer compares.
+        self.cli = sys.intern(cli)
         self.timeout = timeout
         self.display = display
+        self.max_retries = max_retries        # extra attempts on transient failures
         self._session_id: str = ""            # populated after first successful call
         self._current_model: str = ""         # set by subclass __init__
         self._fallback_models: list[str] = [] # set by subclass __init__
+        self._model_chain: tuple[str, ...] = ("",)  # rebuilt by _rebuild_model_chain()
+        self._state_lock = threading.Lock()   # guards session/model state when run via run_async
+        self.use_cache = True                 # serve repeat prompts from the response cache
+        self._turns = 0                       # calls made on the current session
+        self._daemon: "subprocess.Popen | None" = None
+        self._daemon_lock = threading.Lock()
+        # Response parsed incrementally by a parse_stream override (codex
+        # JSONL); consumed — and cleared — by the matching parse_output.
+        self._streamed: "AgentResponse | None" = None
+        # Filtered once at construction; rebuilt only via refresh_env().
+        # CLAUDECODE must be stripped or the claude binary refuses to start
+        # inside another Claude Code session.
+        self._env = {k: v for k, v in os.environ.items() if k != "CLAUDECODE"}
 
     @abstractmethod
     def build_command(self, prompt: str, model: str = "", session_id: str = "") -> list[str]:
@@ -79,39 +122,142 @@ class BaseAgent(ABC):
         ...
 
     def parse_output(self, raw: str) -> AgentResponse:
-        """Parse raw CLI output. Default checks for fallback triggers in raw text."""
-        if any(t in raw.lower() for t in _FALLBACK_TRIGGERS):
+        """Parse raw CLI output. Default checks for fallback triggers in raw text.
+
+        Subclasses with a structured parser for their CLI (claude/codex/gemini
+        JSON) detect token-limit errors from typed fields and deliberately do
+        NOT call super() — the substring scan here is the fallback for CLIs
+        without structured output, so successful calls are scanned exactly once.
+        """
+        if _FALLBACK_RE.search(raw):
             raise TokenLimitError(f"{self.ROLE} ({self.cli}) hit token/capacity limit")
         return AgentResponse(text=raw)
 
-    def _get_model_chain(self) -> list[str]:
-        chain = [self._current_model] if self._current_model else [""]
-        for m in self._fallback_models:
-            if m not in chain:
-                chain.append(m)
-        return chain
+    def _rebuild_model_chain(self) -> None:
+        """Recompute the ordered, deduped model chain.
+
+        Called once at construction (by subclasses, after they set the
+        model fields) and again when a fallback model becomes current —
+        not on every run().
+        """
+        chain = [self._current_model or ""] + list(self._fallback_models)
+        self._model_chain = tuple(dict.fromkeys(chain))
 
     def run(self, prompt: str, cwd: "Path | None" = None) -> str:
-        """Execute the CLI tool with the given prompt and return its response."""
-        models = self._get_model_chain()
+        """Execute the CLI tool with the given prompt and return its response.
+
+        Identical (cli, model, prompt) calls are served from the response
+        cache unless use_cache is False; concurrent identical calls are
+        coalesced into a single CLI invocation either way.
+        """
+        from .cache import LLMCache, get_cache, get_singleflight
+
+        cache_key = LLMCache.key(self.cli, self._current_model, prompt)
+        cache = get_cache() if self.use_cache else None
+        if cache is not None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        return get_singleflight().run(
+            cache_key, lambda: self._run_model_chain(prompt, cwd, cache, cache_key)
+        )
+
+    def _run_model_chain(self, prompt: str, cwd, cache, cache_key: str) -> str:
+        """Walk the model chain until one call succeeds; store the result."""
+        models = self._model_chain
         last_exc: Exception = EmptyResponseError(f"{self.ROLE} produced no output")
         for i, model in enumerate(models):
             is_retry = i > 0
             # On fallback: fresh session (different model cannot resume prior session)
-            sid = "" if is_retry else self._session_id
+            with self._state_lock:
+                sid = "" if is_retry else self._session_id
             if is_retry:
+                self.reset_session()
+                self.display.error(
+                    f"{self.ROLE} ({self.cli}): {models[i-1] or 'default'} hit limit "
+                    f"— retrying with {model or 'default'}"
+                )
+            try:
+                # Daemon mode when the CLI supports it; spawn-per-call otherwise
+                raw = self._execute_daemon(prompt)
+                if raw is None:
+                    cmd = self.build_command(prompt, model=model, session_id=sid)
+                    raw = self._execute_with_retry(cmd, cwd)
+                response = self.parse_output(raw)
+                self._record_success(response, model, cache, cache_key)
+                return response.text
+            except TokenLimitError as exc:
+                last_exc = exc
+                if i < len(models) - 1:
+                    continue
+                raise
+            except AgentError:
+                raise
+        raise last_exc
+
+    def _record_success(self, response: AgentResponse, model: str, cache, cache_key: str) -> None:
+        """Update session/model state and the response cache after a success."""
+        with self._state_lock:
+            if response.session_id:
+                self._session_id = response.session_id
+            if model and model != self._current_model:
+                self._current_model = model
+                self._rebuild_model_chain()
+            self._turns += 1
+            if self._turns >= _SESSION_RESET_TURNS:
+                self._session_id = ""
+                self._turns = 0
+        if cache is not None:
+            cache.put(cache_key, response.text)
+
+    def run_async(self, prompt: str, cwd: "Path | None" = None) -> Future:
+        """
+        Dispatch run() on the shared thread pool and return a Future.
+
+        Lets a driver fan out independent Creator/Reviewer/Critic calls so a
+        round costs max(t_i) wall-clock instead of sum(t_i). Each agent's
+        session/model state is guarded by its own lock, so concurrent calls to
+        *different* agents are safe; concurrent calls to the same agent are not
+        coordinated beyond that and should be avoided.
+        """
+        from . import get_pool  # deferred: avoid import cycle with package init
+        return get_pool().submit(self.run, prompt, cwd)
+
+    async def arun(self, prompt: str, cwd: "Path | None" = None) -> str:
+        """Async counterpart of run() built on asyncio subprocesses.
+
+        Scales to many concurrent agents under one event loop without a
+        thread per call (run_async still covers thread-based drivers).
+        Shares the response cache and session/model bookkeeping with run();
+        transient failures surface immediately rather than being retried.
+        """
+        from .cache import LLMCache, get_cache
+
+        cache_key = LLMCache.key(self.cli, self._current_model, prompt)
+        cache = get_cache() if self.use_cache else None
+        if cache is not None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        models = self._model_chain
+        last_exc: Exception = EmptyResponseError(f"{self.ROLE} produced no output")
+        for i, model in enumerate(models):
+            is_retry = i > 0
+            with self._state_lock:
+                sid = "" if is_retry else self._session_id
+            if is_retry:
+                self.reset_session()
                 self.display.error(
                     f"{self.ROLE} ({self.cli}): {models[i-1] or 'default'} hit limit "
                     f"— retrying with {model or 'default'}"
                 )
             try:
                 cmd = self.build_command(prompt, model=model, session_id=sid)
-                raw = self._execute(cmd, cwd)
+                raw = await self._execute_async(cmd, cwd)
                 response = self.parse_output(raw)
-                if response.session_id:
-                    self._session_id = response.session_id
-                if model:
-                    self._current_model = model
+                self._record_success(response, model, cache, cache_key)
                 return response.text
             except TokenLimitError as exc:
                 last_exc = exc
@@ -122,41 +268,267 @@ class BaseAgent(ABC):
                 raise
         raise last_exc
 
-    def _execute(self, cmd: list[str], cwd) -> str:
-        """Clean subprocess execution — no fallback detection."""
-        env = {k: v for k, v in os.environ.items() if k != "CLAUDECODE"}
+    async def _execute_async(self, cmd: list[str], cwd) -> str:
+        """asyncio twin of _execute: one subprocess, timeout-bounded."""
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-                env=env,
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=self._env,
                 cwd=str(cwd) if cwd is not None else None,
             )
-        except subprocess.TimeoutExpired:
+        except FileNotFoundError:
+            raise CLINotFoundError(
+                f"CLI binary '{self.cli}' not found. Is it installed and in PATH?"
+            )
+
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                proc.communicate(), timeout=self.timeout
+            )
+        except asyncio.TimeoutError:
+            proc.kill()
             raise AgentTimeoutError(
                 f"{self.ROLE} ({self.cli}) timed out after {self.timeout}s. "
                 "Try increasing --timeout."
             )
+
+        # Prefer stdout; fall back to stderr for tools that write there on success
+        stderr_text = stderr.decode("utf-8", errors="replace").strip()
+        output = stdout.decode("utf-8", errors="replace").strip()
+        if not output and stderr_text:
+            output = stderr_text
+
+        if not output:
+            raise EmptyResponseError(
+                f"{self.ROLE} ({self.cli}) returned an empty response. "
+                f"Exit code: {proc.returncode}. "
+                f"Stderr: {stderr_text[:300]!r}"
+            )
+
+        return output
+
+    def _execute_with_retry(self, cmd: list[str], cwd) -> str:
+        """Retry _execute on transient failures with Fibonacci backoff.
+
+        Timeouts and empty responses are often flaky network/CLI-daemon
+        hiccups; a couple of short retries beats killing the whole session.
+        TokenLimitError is raised by parse_output, not here, so it still goes
+        straight to the model-fallback chain without retrying.
+        """
+        fib_a, fib_b = 1, 1
+        for attempt in range(self.max_retries + 1):
+            try:
+                return self._execute(cmd, cwd)
+            except (AgentTimeoutError, EmptyResponseError):
+                if attempt == self.max_retries:
+                    raise
+                delay = fib_a * _RETRY_BASE_DELAY * (1.0 + random.random() * 0.25)
+                self.display.error(
+                    f"{self.ROLE} ({self.cli}): transient failure — "
+                    f"retry {attempt + 1}/{self.max_retries} in {delay:.1f}s"
+                )
+                time.sleep(delay)
+                fib_a, fib_b = fib_b, fib_a + fib_b
+
+    # ------------------------------------------------------------------ #
+    # Daemon-mode execution (opt-in per CLI)
+    #
+    # Spawning a fresh Node-based CLI costs 300-800ms of startup before any
+    # real work. A long-lived process fed prompts over stdin would amortize
+    # that once per agent lifetime — but none of the currently supported
+    # CLIs exposes a stable stdin-driven multi-turn protocol in
+    # non-interactive mode (claude -p, codex exec and gemini -p all exit
+    # after one response), so _daemon_command() returns None and every call
+    # takes the spawn-per-call path. Session resume (--resume, see
+    # _SESSION_RESET_TURNS) is the supported startup-amortization today.
+    # ------------------------------------------------------------------ #
+
+    DAEMON_SENTINEL = "<<<END>>>"
+
+    def _daemon_command(self) -> "list[str] | None":
+        """argv for a long-lived stdin-driven CLI process, or None if the
+        CLI only supports spawn-per-call (all current CLIs)."""
+        return None
+
+    def _execute_daemon(self, prompt: str) -> "str | None":
+        """Send a prompt to the persistent CLI process, if one is supported.
+
+        Returns None when daemon mode is unavailable so the caller falls
+        back to spawn-per-call. Protocol: prompt + sentinel line out,
+        response lines until sentinel back.
+        """
+        cmd = self._daemon_command()
+        if cmd is None:
+            return None
+        with self._daemon_lock:
+            if self._daemon is None or self._daemon.poll() is not None:
+                self._daemon = subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    bufsize=1,
+                    env=self._env,
+                )
+            proc = self._daemon
+            proc.stdin.write(prompt + "\n" + self.DAEMON_SENTINEL + "\n")
+            proc.stdin.flush()
+            lines = []
+            for line in proc.stdout:
+                if line.rstrip("\n") == self.DAEMON_SENTINEL:
+                    break
+                lines.append(line)
+            return "".join(lines).strip()
+
+    def parse_stream(self, lines: "Iterator[str]") -> str:
+        """
+        Consume the child's stdout line-by-line and return the collected text.
+
+        The default simply concatenates. The agent classes override this for
+        codex (see their parse_stream) to extract JSONL events incrementally
+        and discard the rest, keeping memory bounded for long transcripts;
+        an override that raises mid-stream aborts the child early.
+        """
+        return "".join(lines)
+
+    def _execute(self, cmd: list[str], cwd) -> str:
+        """Clean subprocess execution — no fallback detection.
+
+        Streams stdout through parse_stream() instead of buffering the whole
+        transcript; stderr is drained on a side thread into a bounded tail.
+
+        The child runs in its own session (start_new_session) so the timeout
+        can kill the whole process group: the CLIs spawn helper processes
+        that inherit the stdout pipe, and killing only the direct child
+        leaves them holding the write end — parse_stream would then block
+        past the deadline until the grandchildren exit on their own.
+        """
+        try:
+            proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=1,
+                env=self._env,
+                cwd=str(cwd) if cwd is not None else None,
+                start_new_session=True,
+            )
         except FileNotFoundError:
             raise CLINotFoundError(
                 f"CLI binary '{self.cli}' not found. Is it installed and in PATH?"
             )
 
+        from . import get_pool  # deferred: avoid import cycle with package init
+
+        # Drain stderr concurrently (bounded tail) so the child never blocks
+        # on a full stderr pipe while we read stdout.
+        stderr_tail: deque = deque(maxlen=64)
+        drain_future = get_pool().submit(self._drain, proc.stderr, stderr_tail)
+
+        timed_out = threading.Event()
+
+        def _kill_on_timeout():
+            timed_out.set()
+            self._kill_process_group(proc)
+            # Backstop: a grandchild that started its own session escapes
+            # the group kill but still holds the pipe's write end — closing
+            # our read ends unblocks parse_stream and _drain regardless.
+            for pipe in (proc.stdout, proc.stderr):
+                try:
+                    pipe.close()
+                except OSError:
+                    pass
+
+        timer = threading.Timer(self.timeout, _kill_on_timeout)
+        timer.start()
+        try:
+            try:
+                output = self.parse_stream(proc.stdout)
+            except ValueError:
+                if not timed_out.is_set():
+                    raise
+                output = ""  # read end closed by the timeout callback
+            except AgentError:
+                # A structured parse_stream can raise mid-transcript. When
+                # the timeout fired, the truncation is our own kill — report
+                # the timeout, not the parser's confusion about it.
+                if timed_out.is_set():
+                    raise AgentTimeoutError(
+                        f"{self.ROLE} ({self.cli}) timed out after {self.timeout}s. "
+                        "Try increasing --timeout."
+                    )
+                raise
+            proc.wait()
+        finally:
+            timer.cancel()
+            self._kill_process_group(proc)
+        try:
+            drain_future.result(timeout=5)
+        except FutureTimeoutError:
+            pass
+
+        if timed_out.is_set():
+            raise AgentTimeoutError(
+                f"{self.ROLE} ({self.cli}) timed out after {self.timeout}s. "
+                "Try increasing --timeout."
+            )
+
         # Prefer stdout; fall back to stderr for tools that write there on success
-        output = result.stdout.strip()
-        if not output and result.stderr.strip():
-            output = result.stderr.strip()
+        stderr_text = "".join(stderr_tail).strip()
+        output = output.strip()
+        if not output and stderr_text:
+            output = stderr_text
 
         if not output:
             raise EmptyResponseError(
                 f"{self.ROLE} ({self.cli}) returned an empty response. "
-                f"Exit code: {result.returncode}. "
-                f"Stderr: {result.stderr[:300]!r}"
+                f"Exit code: {proc.returncode}. "
+                f"Stderr: {stderr_text[:300]!r}"
             )
 
         return output
 
+    @staticmethod
+    def _kill_process_group(proc: "subprocess.Popen") -> None:
+        """Kill the child and everything in its process group.
+
+        The child is its own session leader (start_new_session=True), so its
+        pid doubles as the group id and killpg reaps the helper processes
+        the CLIs spawn. Harmless after a normal exit: the group is already
+        empty and the OSError is swallowed.
+        """
+        killpg = getattr(os, "killpg", None)  # POSIX only
+        if killpg is not None:
+            try:
+                killpg(proc.pid, signal.SIGKILL)
+                return
+            except OSError:
+                pass  # group already gone
+        proc.kill()
+
+    @staticmethod
+    def _drain(pipe, tail: deque) -> None:
+        """Read a pipe to EOF, keeping only the last maxlen lines."""
+        try:
+            for line in pipe:
+                tail.append(line)
+        except ValueError:
+            pass  # pipe closed mid-read during kill
+
+    def reset_session(self) -> None:
+        """Drop the tracked CLI session so the next call starts fresh."""
+        with self._state_lock:
+            self._session_id = ""
+            self._turns = 0
+
+    def refresh_env(self) -> None:
+        """Re-snapshot os.environ (for callers that mutate env between calls)."""
+        self._env = {k: v for k, v in os.environ.items() if k != "CLAUDECODE"}
+
     def is_available(self) -> bool:
-        return shutil.which(self.cli) is not None
+        from . import which  # deferred: avoid import cycle with package init
+        return which(self.cli) is not None
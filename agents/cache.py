@@ -0,0 +1,152 @@
+"""
+agents/cache.py
+
+Response cache for agent calls.
+
+Every run() is a multi-second, dollar-costing external CLI invocation, so
+identical prompts to the same (cli, model) pair are served from cache on
+repeat — which makes test/dev iteration on the orchestrator near-instant.
+
+Two tiers: a small in-memory LRU for the current process, backed by a
+SQLite table under ./sessions/ that persists across runs. Agent calls are
+serial per process, so single-writer SQLite is fine.
+
+Note: a cache hit replays only the captured response text, not any files
+the CLI wrote into the workspace as a side effect. That is safe for the
+text-producing Reviewer and Critic (the orchestrator falls back to captured
+stdout when a workspace file is missing), but not for the Creator, whose
+real output *is* the workspace files — the Creator is therefore excluded
+from the cache (use_cache=False, see CreatorAgent). --no-cache disables the
+cache for the other roles too.
+"""
+
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Callable, Optional
+
+CACHE_DB = Path(__file__).resolve().parent.parent / "sessions" / "llm_cache.db"
+
+_MEMORY_ENTRIES = 256
+
+
+class LLMCache:
+    """Two-tier (memory LRU + SQLite) cache keyed by a response hash."""
+
+    def __init__(self, db_path: Path = CACHE_DB) -> None:
+        self._db_path = db_path
+        self._mem: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @staticmethod
+    def key(cli: str, model: str, prompt: str) -> str:
+        """Hash (cli, model, prompt) — blake2b beats sha256 on small inputs."""
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f"{cli}\x00{model}\x00".encode("utf-8"))
+        h.update(prompt.encode("utf-8"))
+        return h.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            text = self._mem.get(key)
+            if text is not None:
+                self._mem.move_to_end(key)
+                return text
+            row = self._db().execute(
+                "SELECT text FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._remember(key, row[0])
+            return row[0]
+
+    def put(self, key: str, text: str) -> None:
+        with self._lock:
+            self._remember(key, text)
+            conn = self._db()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, text) VALUES (?, ?)",
+                (key, text),
+            )
+            conn.commit()
+
+    # ------------------------------------------------------------------ #
+    # Internals (caller holds the lock)
+    # ------------------------------------------------------------------ #
+
+    def _remember(self, key: str, text: str) -> None:
+        self._mem[key] = text
+        self._mem.move_to_end(key)
+        if len(self._mem) > _MEMORY_ENTRIES:
+            self._mem.popitem(last=False)
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, text TEXT)"
+            )
+        return self._conn
+
+
+class SingleFlight:
+    """Coalesce concurrent identical calls into one execution.
+
+    If two callers fire the same (cli, model, prompt) within the same window
+    (e.g. parallel panes asking to "check the last diff"), the first spawns
+    the CLI and the second just waits on its Future — one external call, two
+    results.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def run(self, key: str, fn: Callable[[], str]) -> str:
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                leader = False
+            else:
+                future = Future()
+                self._inflight[key] = future
+                leader = True
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+
+_shared_cache: Optional[LLMCache] = None
+_shared_flight = SingleFlight()
+_shared_lock = threading.Lock()
+
+
+def get_cache() -> LLMCache:
+    """Process-wide cache instance, created on first use."""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = LLMCache()
+        return _shared_cache
+
+
+def get_singleflight() -> SingleFlight:
+    """Process-wide call coalescer shared by all agents."""
+    return _shared_flight
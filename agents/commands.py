@@ -0,0 +1,71 @@
+"""
+agents/commands.py
+
+Argv builder factories for the supported CLI binaries.
+
+Each factory is called once at import time (per agent class) and returns a
+builder `(prompt, model, session_id) -> list[str]`. The per-class _COMMANDS
+dicts map binary name -> builder, so build_command is a single dict lookup
+plus a handful of list concatenations instead of a re-evaluated if-ladder.
+"""
+
+
+def claude_command(allowed_tools: str):
+    """Builder for: claude --output-format json [-p prompt] with a tool allowlist."""
+    base = ["claude", "--output-format", "json"]
+    tail = ["--allowedTools", allowed_tools]
+
+    def build(prompt: str, model: str = "", session_id: str = "") -> list[str]:
+        cmd = list(base)
+        if model:
+            cmd += ["--model", model]
+        if session_id:
+            cmd += ["--resume", session_id]
+        cmd += ["-p", prompt]
+        cmd += tail
+        return cmd
+
+    return build
+
+
+def codex_command():
+    """Builder for: codex exec --json --skip-git-repo-check (resume-aware)."""
+
+    def build(prompt: str, model: str = "", session_id: str = "") -> list[str]:
+        if session_id:
+            cmd = ["codex", "exec"]
+            if model:
+                cmd += ["-m", model]
+            cmd += ["resume", "--json", "--skip-git-repo-check", session_id, prompt]
+        else:
+            cmd = ["codex"]
+            if model:
+                cmd += ["-m", model]
+            cmd += ["exec", "--json", "--skip-git-repo-check", prompt]
+        return cmd
+
+    return build
+
+
+def gemini_command(yolo: bool = False, resume: bool = False):
+    """Builder for: gemini --output-format json [-p prompt].
+
+    session_id acts as a truthy flag only — gemini only accepts "latest"/index
+    for --resume, so the stored UUID is kept for tracking and `--resume
+    latest` picks up the most recent gemini session *process-wide*. Only the
+    Critic opts in (resume=True): with two gemini roles in one run, any other
+    role resuming "latest" could continue the other agent's conversation.
+    """
+    base = ["gemini", "--approval-mode", "yolo"] if yolo else ["gemini"]
+    base += ["--output-format", "json"]
+
+    def build(prompt: str, model: str = "", session_id: str = "") -> list[str]:
+        cmd = list(base)
+        if model:
+            cmd += ["--model", model]
+        if resume and session_id:
+            cmd += ["--resume", "latest"]
+        cmd += ["-p", prompt]
+        return cmd
+
+    return build
@@ -5,25 +5,27 @@ Creator agent — writes and revises code.
 Default CLI: claude  (invoked as: claude --output-format json -p "prompt")
 """
 
-import re
+from typing import Iterator
 
 from .base_agent import BaseAgent, AgentResponse
+from .commands import claude_command, codex_command, gemini_command
+from .models import DEFAULT_CHAIN, MODEL_CHAINS
 from .parsers import parse_claude_json, parse_codex_jsonl, parse_gemini_json
 
-# Maps CLI -> (primary_model, fallback_models)
-_MODEL_CHAINS: dict[str, tuple[str, list[str]]] = {
-    "claude": ("claude-sonnet-4-5-20250929", ["claude-haiku-4-5-20251001"]),
-    "codex":  ("gpt-5.3-codex",              ["o4-mini"]),
-    "gemini": ("gemini-2.5-pro",             ["gemini-2.5-flash", "gemini-2.5-flash-lite"]),
-}
-
-# Matches an optional opening ```<lang> fence and/or a closing ``` fence
-_FENCE_RE = re.compile(r"^```[\w]*\n?|\n?```$", re.MULTILINE)
-
 
 def _strip_fences(text: str) -> str:
-    """Remove markdown code fences that some LLMs add despite being told not to."""
-    return _FENCE_RE.sub("", text).strip()
+    """Remove markdown code fences that some LLMs add despite being told not to.
+
+    Fences only ever appear as the first/last line, so a startswith/endswith
+    slice is enough — no need to regex-scan the whole response body.
+    """
+    s = text.strip()
+    if s.startswith("```"):
+        nl = s.find("\n")
+        s = s[nl + 1:] if nl > 0 else s[3:]
+    if s.endswith("```"):
+        s = s[:-3].rstrip()
+    return s
 
 
 class CreatorAgent(BaseAgent):
@@ -32,50 +34,52 @@ class CreatorAgent(BaseAgent):
 
     def __init__(self, cli: str, timeout: int, display):
         super().__init__(cli, timeout, display)
-        self._current_model, self._fallback_models = _MODEL_CHAINS.get(cli, ("", []))
+        self._current_model, fallbacks = MODEL_CHAINS.get(cli, DEFAULT_CHAIN)
+        self._fallback_models = list(fallbacks)
+        self._rebuild_model_chain()
+        # The response cache replays stdout text only, but the Creator's
+        # real work is the files it writes into the workspace: a hit would
+        # skip the CLI entirely and leave solution.py unrevised while the
+        # loop appeared to run. Never serve the Creator from cache.
+        self.use_cache = False
+
+    # binary -> argv builder; resolved once at class definition
+    _COMMANDS = {
+        "claude": claude_command("Bash,Write,Read,Edit,Glob,Grep,Task"),
+        "codex":  codex_command(),
+        "gemini": gemini_command(),
+    }
 
     def build_command(self, prompt: str, model: str = "", session_id: str = "") -> list[str]:
-        if self.cli == "claude":
-            cmd = ["claude", "--output-format", "json"]
-            if model:
-                cmd += ["--model", model]
-            if session_id:
-                cmd += ["--resume", session_id]
-            cmd += ["-p", prompt, "--allowedTools", "Bash,Write,Read,Edit,Glob,Grep,Task"]
-            return cmd
-
-        if self.cli == "codex":
-            if session_id:
-                cmd = ["codex", "exec"]
-                if model:
-                    cmd += ["-m", model]
-                cmd += ["resume", "--json", "--skip-git-repo-check", session_id, prompt]
-            else:
-                cmd = ["codex"]
-                if model:
-                    cmd += ["-m", model]
-                cmd += ["exec", "--json", "--skip-git-repo-check", prompt]
-            return cmd
-
-        if self.cli == "gemini":
-            cmd = ["gemini", "--output-format", "json"]
-            if model:
-                cmd += ["--model", model]
-            # NOTE: session_id is NOT used as --resume value for gemini
-            # (only accepts "latest"/index). UUID stored for tracking only.
-            cmd += ["-p", prompt]
-            return cmd
-
-        raise ValueError(f"Unsupported CLI for CreatorAgent: {self.cli!r}")
+        try:
+            builder = self._COMMANDS[self.cli]
+        except KeyError:
+            raise ValueError(f"Unsupported CLI for CreatorAgent: {self.cli!r}")
+        return builder(prompt, model, session_id)
+
+    def parse_stream(self, lines: "Iterator[str]") -> str:
+        if self.cli != "codex":
+            return super().parse_stream(lines)
+        # Feed the JSONL parser the live iterator: memory stays bounded by
+        # the extracted message instead of the full transcript, and a
+        # token-limit event raises mid-stream, aborting the child early.
+        self._streamed = None
+        self._streamed = parse_codex_jsonl(lines)
+        return self._streamed.text
 
     def parse_output(self, raw: str) -> AgentResponse:
         if self.cli == "claude":
             return parse_claude_json(raw)
         if self.cli == "codex":
+            streamed, self._streamed = self._streamed, None
+            if streamed is not None and streamed.text == raw:
+                return streamed  # already parsed incrementally off the pipe
             return parse_codex_jsonl(raw)
         if self.cli == "gemini":
             return parse_gemini_json(raw)
-        return AgentResponse(text=raw)
+        # Unknown CLI: no structured parser — fall back to the base
+        # substring scan for token/capacity triggers.
+        return super().parse_output(raw)
 
     def run(self, prompt: str, cwd=None) -> str:
         return _strip_fences(super().run(prompt, cwd=cwd))
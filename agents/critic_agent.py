@@ -5,16 +5,13 @@ Critic agent — challenges the review, finds missed issues, flags false positiv
 Default CLI: gemini  (invoked as: gemini --output-format json -p "prompt")
 """
 
+from typing import Iterator
+
 from .base_agent import BaseAgent, AgentResponse
+from .commands import claude_command, codex_command, gemini_command
+from .models import DEFAULT_CHAIN, MODEL_CHAINS
 from .parsers import parse_claude_json, parse_codex_jsonl, parse_gemini_json
 
-# Maps CLI -> (primary_model, fallback_models)
-_MODEL_CHAINS: dict[str, tuple[str, list[str]]] = {
-    "claude": ("claude-sonnet-4-5-20250929", ["claude-haiku-4-5-20251001"]),
-    "codex":  ("gpt-5.3-codex",              ["o4-mini"]),
-    "gemini": ("gemini-2.5-pro",             ["gemini-2.5-flash", "gemini-2.5-flash-lite"]),
-}
-
 
 class CriticAgent(BaseAgent):
     ROLE = "Critic"
@@ -22,48 +19,45 @@ class CriticAgent(BaseAgent):
 
     def __init__(self, cli: str, timeout: int, display):
         super().__init__(cli, timeout, display)
-        self._current_model, self._fallback_models = _MODEL_CHAINS.get(cli, ("", []))
+        self._current_model, fallbacks = MODEL_CHAINS.get(cli, DEFAULT_CHAIN)
+        self._fallback_models = list(fallbacks)
+        self._rebuild_model_chain()
+
+    # binary -> argv builder; resolved once at class definition.
+    # Critic is read-only: no Write/Edit in the claude tool allowlist.
+    _COMMANDS = {
+        "claude": claude_command("Bash,Read,Glob,Grep"),
+        "codex":  codex_command(),
+        "gemini": gemini_command(yolo=True, resume=True),
+    }
 
     def build_command(self, prompt: str, model: str = "", session_id: str = "") -> list[str]:
-        if self.cli == "gemini":
-            cmd = ["gemini", "--approval-mode", "yolo", "--output-format", "json"]
-            if model:
-                cmd += ["--model", model]
-            # session_id acts as truthy flag only — gemini only accepts "latest"/index
-            if session_id:
-                cmd += ["--resume", "latest"]
-            cmd += ["-p", prompt]
-            return cmd
-
-        if self.cli == "claude":
-            cmd = ["claude", "--output-format", "json"]
-            if model:
-                cmd += ["--model", model]
-            if session_id:
-                cmd += ["--resume", session_id]
-            cmd += ["-p", prompt, "--allowedTools", "Bash,Read,Glob,Grep"]
-            return cmd
-
-        if self.cli == "codex":
-            if session_id:
-                cmd = ["codex", "exec"]
-                if model:
-                    cmd += ["-m", model]
-                cmd += ["resume", "--json", "--skip-git-repo-check", session_id, prompt]
-            else:
-                cmd = ["codex"]
-                if model:
-                    cmd += ["-m", model]
-                cmd += ["exec", "--json", "--skip-git-repo-check", prompt]
-            return cmd
-
-        raise ValueError(f"Unsupported CLI for CriticAgent: {self.cli!r}")
+        try:
+            builder = self._COMMANDS[self.cli]
+        except KeyError:
+            raise ValueError(f"Unsupported CLI for CriticAgent: {self.cli!r}")
+        return builder(prompt, model, session_id)
+
+    def parse_stream(self, lines: "Iterator[str]") -> str:
+        if self.cli != "codex":
+            return super().parse_stream(lines)
+        # Feed the JSONL parser the live iterator: memory stays bounded by
+        # the extracted message instead of the full transcript, and a
+        # token-limit event raises mid-stream, aborting the child early.
+        self._streamed = None
+        self._streamed = parse_codex_jsonl(lines)
+        return self._streamed.text
 
     def parse_output(self, raw: str) -> AgentResponse:
         if self.cli == "claude":
             return parse_claude_json(raw)
         if self.cli == "codex":
+            streamed, self._streamed = self._streamed, None
+            if streamed is not None and streamed.text == raw:
+                return streamed  # already parsed incrementally off the pipe
             return parse_codex_jsonl(raw)
         if self.cli == "gemini":
             return parse_gemini_json(raw)
-        return AgentResponse(text=raw)
+        # Unknown CLI: no structured parser — fall back to the base
+        # substring scan for token/capacity triggers.
+        return super().parse_output(raw)
@@ -0,0 +1,20 @@
+"""
+agents/models.py
+
+Primary and fallback model chains per CLI binary.
+
+Shared by all three agent roles — previously each agent module carried an
+identical private copy, which tripled import-time work and was a
+maintenance hazard when model names changed. Fallback lists are frozen as
+tuples so instances can share them without defensive copies.
+"""
+
+# Maps CLI -> (primary_model, fallback_models)
+MODEL_CHAINS: dict[str, tuple[str, tuple[str, ...]]] = {
+    "claude": ("claude-sonnet-4-5-20250929", ("claude-haiku-4-5-20251001",)),
+    "codex":  ("gpt-5.3-codex",              ("o4-mini",)),
+    "gemini": ("gemini-2.5-pro",             ("gemini-2.5-flash", "gemini-2.5-flash-lite")),
+}
+
+# Chain for CLIs without a configured model (use the binary's own default).
+DEFAULT_CHAIN: tuple[str, tuple[str, ...]] = ("", ())
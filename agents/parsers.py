@@ -1,11 +1,19 @@
 """agents/parsers.py — CLI-specific output parsers."""
-import json
 from .base_agent import AgentResponse, TokenLimitError, EmptyResponseError
 
+# orjson (C implementation) is ~3-5x faster on the large Codex JSONL
+# transcripts; fall back to stdlib json when it isn't installed.
+try:
+    import orjson as _json
+    _JSONDecodeError = _json.JSONDecodeError
+except ImportError:  # pragma: no cover - depends on environment
+    import json as _json
+    _JSONDecodeError = _json.JSONDecodeError
+
 
 def parse_claude_json(raw: str) -> AgentResponse:
     try:
-        data = json.loads(raw.strip())
+        data = _json.loads(raw.strip())
         subtype = data.get("subtype", "")
         is_error = data.get("is_error", False)
         text = data.get("result", "")
@@ -16,20 +24,39 @@ def parse_claude_json(raw: str) -> AgentResponse:
             # Other errors (not token limit) — surface as EmptyResponseError
             raise EmptyResponseError(f"Claude error ({subtype}): {text[:200]}")
         return AgentResponse(text=text, session_id=session_id)
-    except (json.JSONDecodeError, KeyError):
+    except (_JSONDecodeError, KeyError):
         return AgentResponse(text=raw)  # graceful fallback to raw text
 
 
-def parse_codex_jsonl(raw: str) -> AgentResponse:
+def parse_codex_jsonl(raw) -> AgentResponse:
+    """Parse Codex JSONL output from a raw string or an iterator of lines.
+
+    Accepting an iterator lets a streaming caller feed lines as they arrive;
+    a token-limit error event aborts the iteration (and the subprocess)
+    without waiting for EOF.
+    """
+    lines = raw.splitlines() if isinstance(raw, str) else raw
     thread_id = ""
     text_parts: list[str] = []
-    for line in raw.splitlines():
+    raw_tail = ""
+    for line in lines:
         line = line.strip()
+        raw_tail = line or raw_tail
         if not line:
             continue
+        # Cheap substring prefilter (memchr-backed __contains__): the vast
+        # majority of JSONL lines are progress/log events we never use, so
+        # skip JSON decoding unless the line can possibly interest us.
+        if (
+            "thread.started" not in line
+            and "item.completed" not in line
+            and "error" not in line
+            and "Error" not in line
+        ):
+            continue
         try:
-            event = json.loads(line)
-        except json.JSONDecodeError:
+            event = _json.loads(line)
+        except _JSONDecodeError:
             continue
         etype = event.get("type", "")
         if etype == "thread.started":
@@ -44,18 +71,21 @@ def parse_codex_jsonl(raw: str) -> AgentResponse:
                 raise TokenLimitError(f"Codex limit: {msg[:200]}")
     text = "\n".join(text_parts).strip()
     if not text:
-        raise EmptyResponseError(f"Codex returned no agent_message. Raw: {raw[:300]!r}")
+        context = raw[:300] if isinstance(raw, str) else raw_tail[:300]
+        raise EmptyResponseError(f"Codex returned no agent_message. Raw: {context!r}")
     return AgentResponse(text=text, session_id=thread_id)
 
 
 def parse_gemini_json(raw: str) -> AgentResponse:
-    # stdout should be clean JSON; handle any unexpected preamble
-    start = raw.find("{")
-    if start > 0:
-        raw = raw[start:]
+    # stdout should be clean JSON; handle any unexpected preamble — but only
+    # scan for it when the first byte isn't already '{' (the common case)
+    if raw[:1] != "{":
+        start = raw.find("{")
+        if start > 0:
+            raw = raw[start:]
     try:
-        data = json.loads(raw)
+        data = _json.loads(raw)
         return AgentResponse(text=data.get("response", raw),
                              session_id=data.get("session_id", ""))
-    except json.JSONDecodeError:
+    except _JSONDecodeError:
         return AgentResponse(text=raw)
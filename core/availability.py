@@ -4,7 +4,7 @@ core/availability.py
 Verify that required CLI tools exist in PATH before starting the session.
 """
 
-import shutil
+from agents import get_pool, which
 
 _TOOL_INFO = {
     "claude": {
@@ -34,9 +34,14 @@ def verify_all_tools(required: set, display) -> None:
     missing = []
 
     display.section("Checking CLI tool availability")
-    for binary in sorted(required):
+    binaries = sorted(required)
+    # Probe all binaries concurrently on the shared agent pool: a PATH
+    # scan can stall per-entry on slow filesystems (network mounts, cold
+    # directory caches), and the probes are independent. Results come
+    # back in input order, so the status lines stay deterministic.
+    paths = list(get_pool().map(which, binaries))
+    for binary, path in zip(binaries, paths):
         info = _TOOL_INFO.get(binary, {"name": binary, "install": "see tool documentation"})
-        path = shutil.which(binary)
         if path:
             display.tool_found(info["name"], binary, path)
         else:
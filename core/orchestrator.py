@@ -7,15 +7,19 @@ Flow:
   Phase 0 — Creator generates initial code, writes solution.py + tests.py, runs tests.
   Loop (N cycles):
     (a) Reviewer reads workspace files, runs tests, writes reviews/review_{i}.md
-    (b) Critic    receives code+review inline → returns text → saved to reviews/critique_{i}.md
+    (b) Critic    reads solution+review by file reference → returns text → saved to reviews/critique_{i}.md
     (c) Creator   reads review+critique, revises solution.py, re-runs tests
   Returns the final Session with all state recorded.
 """
 
+import asyncio
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
 from agents.base_agent import AgentError
+from core import task_cache
 from core.session import Session, SessionConfig
 from core.workspace import Workspace
-from prompts.templates import PromptBuilder
+from prompts.templates import DEFAULT_BUILDER
 
 
 class OrchestratorError(Exception):
@@ -23,24 +27,56 @@ class OrchestratorError(Exception):
 
 
 class Orchestrator:
-    def __init__(self, creator, reviewer, critic, iterations: int, display):
+    def __init__(self, creator, reviewer, critic, iterations: int, display,
+                 autosave: bool = True, reuse_sessions: bool = True):
         self.creator = creator
         self.reviewer = reviewer
         self.critic = critic
         self.iterations = iterations
         self.display = display
-        self.prompts = PromptBuilder()
-
-    def run(self, task: str) -> Session:
-        session = Session(
-            task=task,
-            config=SessionConfig(
-                creator=self.creator.cli,
-                reviewer=self.reviewer.cli,
-                critic=self.critic.cli,
-                iterations=self.iterations,
-            ),
-        )
+        self.autosave = autosave  # append session events to disk after each cycle
+        self.reuse_sessions = reuse_sessions  # seed Phase 0 from near-duplicate tasks
+        self.prompts = DEFAULT_BUILDER  # shared singleton — one render memo
+
+    def run(self, task: str, resume: "Session | None" = None) -> Session:
+        # One persistent Live region spans the whole run; each spinner
+        # phase updates it in place (see ConsoleDisplay.live_session).
+        with self.display.live_session():
+            return self._run(task, resume)
+
+    async def arun(self, task: str) -> Session:
+        """Run the pipeline from an asyncio caller without blocking the loop.
+
+        The per-cycle phases form a strict chain (critic needs the review on
+        disk, creator needs the critique), so an async task DAG degenerates
+        to the same sequence; the real overlap — rendering and bookkeeping
+        against subprocess waits — already happens via run_async dispatch
+        inside the loop. This adapter exists so several orchestrator runs
+        (distinct tasks) can share one event loop concurrently.
+        """
+        return await asyncio.to_thread(self.run, task)
+
+    def _run(self, task: str, resume: "Session | None" = None) -> Session:
+        if resume is not None:
+            # Resume an interrupted run from its incremental event log
+            # (Session.find_resumable). Cycles that already produced a
+            # revision are skipped; a partially-recorded cycle is dropped
+            # and rerun in full — replay handles the restarted "iteration"
+            # event by truncating the stale partial record.
+            session = resume
+            session.iterations = [it for it in session.iterations if it.revision]
+            start_cycle = len(session.iterations) + 1
+        else:
+            session = Session(
+                task=task,
+                config=SessionConfig(
+                    creator=self.creator.cli,
+                    reviewer=self.reviewer.cli,
+                    critic=self.critic.cli,
+                    iterations=self.iterations,
+                ),
+            )
+            start_cycle = 1
 
         # Set up shared workspace
         workspace = Workspace(session.id)
@@ -51,37 +87,69 @@ class Orchestrator:
         # ---------------------------------------------------------------- #
         # Phase 0: Initial code generation
         # ---------------------------------------------------------------- #
-        self.display.phase_header("Initial Code Generation", phase=0, total=self.iterations)
-
-        creator_output = self._call(
-            self.creator,
-            self.prompts.creator_initial(task),
-            "Generating initial code...",
-            cwd=workspace.path,
-        )
-
-        # Prefer the file the agent wrote; fall back to captured stdout
-        solution = workspace.read_solution() or creator_output
-        session.set_initial_code(solution)
-
-        self.display.agent_output(
-            role=self.creator.ROLE,
-            color=self.creator.COLOR,
-            cli=self.creator.cli,
-            content=creator_output,
-            is_code=False,
-            label="Initial Implementation",
-        )
-
-        # Run tests and display results
-        test_output = workspace.run_tests()
-        if test_output:
-            self.display.test_results(test_output)
+        if resume is not None:
+            # Phase 0 (and every completed cycle) is already on disk.
+            self.display.success(
+                f"Resuming {session.id} at cycle {start_cycle}/{self.iterations}"
+            )
+            solution_text, solution_mtime = workspace.read_solution_if_changed()
+            if solution_text is None:
+                # Workspace survived but solution.py didn't — restore it
+                # from the last code the event log recorded.
+                workspace.solution_path.write_text(session.current_code, encoding="utf-8")
+                solution_text, solution_mtime = workspace.read_solution_if_changed()
+            # The crashed run may have left a complete review/critique for
+            # the cycle being rerun. The early-critic dispatch in the loop
+            # keys on review_{i}.md existing with a stable size, so a stale
+            # file would send the critic off against a review the rerun
+            # reviewer is about to overwrite. Clear both so the rerun cycle
+            # starts from an empty slate.
+            workspace.review_path(start_cycle).unlink(missing_ok=True)
+            workspace.critique_path(start_cycle).unlink(missing_ok=True)
+        else:
+            self.display.phase_header("Initial Code Generation", phase=0, total=self.iterations)
+
+            # A completed session with a near-identical task seeds solution.py
+            # and skips the Creator's initial call; the review cycles take it
+            # from there (and will ask for tests if the seed lacks them).
+            seed = task_cache.lookup(task) if self.reuse_sessions else None
+            if seed is not None:
+                prior_task, final_code = seed
+                workspace.solution_path.write_text(final_code, encoding="utf-8")
+                self.display.success(f'Reusing solution from prior session: "{prior_task}"')
+                creator_output = final_code
+            else:
+                creator_output = self._call(
+                    self.creator,
+                    self.prompts.creator_initial(task),
+                    "Generating initial code...",
+                    cwd=workspace.path,
+                )
+
+            # Prefer the file the agent wrote; fall back to captured stdout.
+            # solution_text/solution_mtime track the file across the loop so an
+            # unchanged file is never re-read (one stat per check).
+            solution_text, solution_mtime = workspace.read_solution_if_changed()
+            session.set_initial_code(solution_text or creator_output)
+
+            self.display.agent_output(
+                role=self.creator.ROLE,
+                color=self.creator.COLOR,
+                cli=self.creator.cli,
+                content=creator_output,
+                is_code=False,
+                label="Initial Implementation",
+            )
+
+            # Run tests and display results
+            test_output = workspace.run_tests()
+            if test_output:
+                self.display.test_results(test_output)
 
         # ---------------------------------------------------------------- #
         # Iterative loop
         # ---------------------------------------------------------------- #
-        for i in range(1, self.iterations + 1):
+        for i in range(start_cycle, self.iterations + 1):
             session.start_iteration(i)
             self.display.phase_header(f"Review Cycle {i}", phase=i, total=self.iterations)
 
@@ -102,17 +170,64 @@ class Orchestrator:
                     cycle=i,
                 )
 
-            reviewer_output = self._call(
-                self.reviewer,
-                review_prompt,
-                f"[{i}/{self.iterations}] Reviewing code...",
-                cwd=workspace.path,
+            # The critic prompt references workspace files (O(1) size), so
+            # it is buildable — and dispatchable — before the reviewer call
+            # even returns: as soon as the review file is complete on disk.
+            # From cycle 2, a diff of the last revision narrows the critic's
+            # fresh analysis to the code that actually changed.
+            critique_prompt = self.prompts.critic(
+                task=task,
+                cycle=i,
+                prior_critique_ref=f"reviews/critique_{i - 1}.md" if i > 1 else None,
+                diff_ref=workspace.write_solution_diff(i) if i > 1 else None,
             )
 
+            reviewer_future = self.reviewer.run_async(review_prompt, cwd=workspace.path)
+            critique_future = None
+            prev_size = -1
+            try:
+                with self.display.spinner(
+                    f"[{i}/{self.iterations}] Reviewing code...", color=self.reviewer.COLOR
+                ):
+                    while True:
+                        try:
+                            reviewer_output = reviewer_future.result(timeout=0.5)
+                            break
+                        except FutureTimeoutError:
+                            if critique_future is not None:
+                                continue
+                            # Reviewer CLIs write the review file before they
+                            # finish emitting their stdout transcript. Launch
+                            # the critic early once the file has a stable size
+                            # and its final rubric section — overlapping the
+                            # critic's startup with the reviewer's tail.
+                            try:
+                                size = workspace.review_path(i).stat().st_size
+                            except OSError:
+                                continue
+                            if size and size == prev_size and "VERDICT" in workspace.read_review(i):
+                                critique_future = self.critic.run_async(
+                                    critique_prompt, cwd=workspace.path
+                                )
+                            prev_size = size
+            except AgentError as exc:
+                if critique_future is not None:
+                    critique_future.cancel()
+                self.display.agent_error(self.reviewer.ROLE, self.reviewer.cli, str(exc))
+                raise OrchestratorError(f"{self.reviewer.ROLE} failed: {exc}") from exc
+
             # Prefer the file the reviewer wrote; fall back to captured stdout
-            review = workspace.read_review(i) or reviewer_output
+            # (materialized to the file so the critic can read it by reference)
+            review = workspace.read_review(i)
+            if not review:
+                review = reviewer_output
+                workspace.write_review(i, review)
             session.set_review(i, review)
 
+            # (b) Critic -------------------------------------------------- #
+            if critique_future is None:
+                critique_future = self.critic.run_async(critique_prompt, cwd=workspace.path)
+
             self.display.agent_output(
                 role=self.reviewer.ROLE,
                 color=self.reviewer.COLOR,
@@ -122,28 +237,25 @@ class Orchestrator:
                 label=f"Review (cycle {i})",
             )
 
-            # (b) Critic -------------------------------------------------- #
-            solution = workspace.read_solution() or session.current_code
-            prior_critique = workspace.read_critique(i - 1) if i > 1 else None
-
-            critique_prompt = self.prompts.critic(
-                task=task,
-                solution_code=solution,
-                review_text=review,
-                cycle=i,
-                prior_critique=prior_critique,
-            )
-            critique = self._call(
+            critique = self._await(
                 self.critic,
-                critique_prompt,
+                critique_future,
                 f"[{i}/{self.iterations}] Critiquing the review...",
-                cwd=workspace.path,
             )
 
-            # Critic returns text — save it to file for future agents to read
+            # Critic returns text — save it to file for future agents to read.
+            # Must happen before the Creator dispatch below: the revision
+            # prompt tells the Creator to read reviews/critique_{i}.md.
             workspace.write_critique(i, critique)
             session.set_critique(i, critique)
 
+            # (c) Creator revision ---------------------------------------- #
+            # Same overlap: dispatch the revision, then render the critique.
+            revision_future = self.creator.run_async(
+                self.prompts.creator_revision(task=task, cycle=i),
+                cwd=workspace.path,
+            )
+
             self.display.agent_output(
                 role=self.critic.ROLE,
                 color=self.critic.COLOR,
@@ -153,16 +265,18 @@ class Orchestrator:
                 label=f"Challenge (cycle {i})",
             )
 
-            # (c) Creator revision ---------------------------------------- #
-            revision_output = self._call(
+            revision_output = self._await(
                 self.creator,
-                self.prompts.creator_revision(task=task, cycle=i),
+                revision_future,
                 f"[{i}/{self.iterations}] Revising code...",
-                cwd=workspace.path,
             )
 
-            # Prefer file; fall back to stdout
-            revision = workspace.read_solution() or revision_output
+            # Prefer file; fall back to stdout. An unchanged mtime means the
+            # creator left solution.py alone — reuse the tracked contents.
+            new_text, solution_mtime = workspace.read_solution_if_changed(solution_mtime)
+            if new_text is not None:
+                solution_text = new_text
+            revision = solution_text or revision_output
             session.set_revision(i, revision)
 
             self.display.agent_output(
@@ -179,14 +293,26 @@ class Orchestrator:
             if test_output:
                 self.display.test_results(test_output)
 
+            if self.autosave:
+                session.save_incremental()
+
         session.complete()
+        if self.autosave:
+            session.save_incremental()
         return session
 
     def _call(self, agent, prompt: str, spinner_text: str, cwd=None) -> str:
         """Run an agent call with a spinner and unified error handling."""
+        return self._await(agent, agent.run_async(prompt, cwd=cwd), spinner_text)
+
+    def _await(self, agent, future, spinner_text: str) -> str:
+        """Block on an in-flight agent Future with a spinner and unified
+        error handling. Dispatching via run_async() and awaiting late lets
+        the loop overlap display rendering and file bookkeeping with the
+        agent's subprocess call."""
         try:
             with self.display.spinner(spinner_text, color=agent.COLOR):
-                return agent.run(prompt, cwd=cwd)
+                return future.result()
         except AgentError as exc:
             self.display.agent_error(agent.ROLE, agent.cli, str(exc))
             raise OrchestratorError(f"{agent.ROLE} failed: {exc}") from exc
@@ -20,7 +20,22 @@ Schema:
 """
 
 import json
+import time
 from dataclasses import dataclass, field
+
+# orjson (C implementation) serializes the large code/review strings
+# 3-10x faster than stdlib json; fall back when it isn't installed.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+# zstandard compresses transcripts (mostly code and prose — highly
+# redundant) to roughly half size at level 3; plain .json when absent.
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - depends on environment
+    zstandard = None
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -28,6 +43,32 @@ from typing import Optional
 SESSIONS_DIR = Path(__file__).resolve().parent.parent / "sessions"
 
 
+def _iso(ns: int) -> str:
+    """Format a time.time_ns() timestamp as an ISO-8601 string."""
+    return datetime.fromtimestamp(ns / 1e9).isoformat(timespec="seconds")
+
+
+def _parse_iso_ns(text: str) -> int:
+    return int(datetime.fromisoformat(text).timestamp() * 1e9)
+
+
+def read_transcript(path: Path) -> dict:
+    """Load a saved transcript, decompressing .json.zst transparently.
+
+    Raises ValueError when the file is compressed but zstandard is not
+    installed (callers scanning sessions/ treat it like a corrupt file).
+    """
+    path = Path(path)
+    data = path.read_bytes()
+    if path.suffix == ".zst":
+        if zstandard is None:
+            raise ValueError(f"{path}: compressed transcript but zstandard is not installed")
+        data = zstandard.ZstdDecompressor().decompress(data)
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 @dataclass
 class IterationRecord:
     number: int
@@ -49,12 +90,18 @@ class Session:
     task: str
     config: SessionConfig
     id: str = field(default_factory=lambda: f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
-    started_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    completed_at: Optional[str] = None
+    # Timestamps are stored as integer nanoseconds (cheap to take, trivial
+    # to fake in tests) and rendered to ISO strings only at serialization.
+    started_ns: int = field(default_factory=time.time_ns)
+    completed_ns: Optional[int] = None
     initial_code: str = ""
     final_code: str = ""
     workspace_path: str = ""
     iterations: list = field(default_factory=list)  # list[IterationRecord]
+    # Append-only event log backing save_incremental(); _flushed counts
+    # events already written to the .jsonl file.
+    _events: list = field(default_factory=list, repr=False)
+    _flushed: int = field(default=0, repr=False)
 
     # ------------------------------------------------------------------ #
     # Mutators — called by the orchestrator as events occur
@@ -63,24 +110,42 @@ class Session:
     def set_initial_code(self, code: str) -> None:
         self.initial_code = code
         self.final_code = code
+        self._events.append({"t": "initial", "v": code})
 
     def start_iteration(self, number: int) -> IterationRecord:
         record = IterationRecord(number=number)
         self.iterations.append(record)
+        self._events.append({"t": "iteration", "i": number})
         return record
 
     def set_review(self, iteration: int, review: str) -> None:
         self.iterations[iteration - 1].review = review
+        self._events.append({"t": "review", "i": iteration, "v": review})
 
     def set_critique(self, iteration: int, critique: str) -> None:
         self.iterations[iteration - 1].critique = critique
+        self._events.append({"t": "critique", "i": iteration, "v": critique})
 
     def set_revision(self, iteration: int, revision: str) -> None:
         self.iterations[iteration - 1].revision = revision
         self.final_code = revision
+        self._events.append({"t": "revision", "i": iteration, "v": revision})
 
     def complete(self) -> None:
-        self.completed_at = datetime.now().isoformat()
+        self.completed_ns = time.time_ns()
+        self._events.append({"t": "complete", "at": self.completed_at})
+
+    # ------------------------------------------------------------------ #
+    # Timestamp views — ISO strings for the persisted schema
+    # ------------------------------------------------------------------ #
+
+    @property
+    def started_at(self) -> str:
+        return _iso(self.started_ns)
+
+    @property
+    def completed_at(self) -> Optional[str]:
+        return _iso(self.completed_ns) if self.completed_ns is not None else None
 
     # ------------------------------------------------------------------ #
     # State accessors — used by Orchestrator to build prompts
@@ -145,9 +210,132 @@ class Session:
             ],
         }
 
+    def to_columns(self) -> dict:
+        """Columnar (struct-of-arrays) view of the transcript.
+
+        One list per field, aligned by cycle index. Analytics that only
+        care about one field (plotting review length growth, diffing
+        revisions) iterate a single homogeneous list instead of walking
+        every per-iteration record and loading all of its fields.
+        """
+        records = self.iterations
+        return {
+            "number": [it.number for it in records],
+            "review": [it.review for it in records],
+            "critique": [it.critique for it in records],
+            "revision": [it.revision for it in records],
+        }
+
     def save(self) -> Path:
-        """Write session JSON to ./sessions/<id>.json."""
+        """Write session JSON to ./sessions/<id>.json, compressed to
+        <id>.json.zst when zstandard is available."""
+        SESSIONS_DIR.mkdir(parents=True, exist_ok=True)
+        if orjson is not None:
+            blob = orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2)
+        else:
+            blob = json.dumps(self.to_dict(), indent=2).encode("utf-8")
+        if zstandard is not None:
+            path = SESSIONS_DIR / f"{self.id}.json.zst"
+            blob = zstandard.ZstdCompressor(level=3).compress(blob)
+        else:
+            path = SESSIONS_DIR / f"{self.id}.json"
+        path.write_bytes(blob)
+        return path
+
+    def save_incremental(self) -> Path:
+        """Append unflushed events to ./sessions/<id>.jsonl.
+
+        Unlike save(), which re-serializes the whole session (quadratic in
+        total content when called every cycle), this writes each review/
+        critique/revision exactly once. A header event with the immutable
+        session fields is written on the first flush; load() replays the
+        log back into an equivalent Session.
+        """
         SESSIONS_DIR.mkdir(parents=True, exist_ok=True)
-        path = SESSIONS_DIR / f"{self.id}.json"
-        path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        path = SESSIONS_DIR / f"{self.id}.jsonl"
+        with path.open("a", encoding="utf-8") as fh:
+            if self._flushed == 0:
+                header = {
+                    "t": "session",
+                    "id": self.id,
+                    "task": self.task,
+                    "started_at": self.started_at,
+                    "workspace_path": self.workspace_path,
+                    "config": {
+                        "creator": self.config.creator,
+                        "reviewer": self.config.reviewer,
+                        "critic": self.config.critic,
+                        "iterations": self.config.iterations,
+                    },
+                }
+                fh.write(json.dumps(header) + "\n")
+            for event in self._events[self._flushed:]:
+                fh.write(json.dumps(event) + "\n")
+            self._flushed = len(self._events)
         return path
+
+    @classmethod
+    def load(cls, jsonl_path: Path) -> "Session":
+        """Rebuild a Session by replaying a save_incremental() event log."""
+        session: Optional[Session] = None
+        with Path(jsonl_path).open(encoding="utf-8") as fh:
+            for line in fh:
+                event = json.loads(line)
+                etype = event["t"]
+                if etype == "session":
+                    session = cls(
+                        task=event["task"],
+                        config=SessionConfig(**event["config"]),
+                        id=event["id"],
+                        started_ns=_parse_iso_ns(event["started_at"]),
+                    )
+                    session.workspace_path = event.get("workspace_path", "")
+                elif session is None:
+                    raise ValueError(f"{jsonl_path}: event before session header")
+                elif etype == "initial":
+                    session.set_initial_code(event["v"])
+                elif etype == "iteration":
+                    # A resumed run restarts an interrupted cycle: replaying
+                    # its fresh "iteration" event discards the partial record
+                    # the crash left behind, keeping indices consistent.
+                    if session.iterations and session.iterations[-1].number >= event["i"]:
+                        del session.iterations[event["i"] - 1:]
+                    session.start_iteration(event["i"])
+                elif etype == "review":
+                    session.set_review(event["i"], event["v"])
+                elif etype == "critique":
+                    session.set_critique(event["i"], event["v"])
+                elif etype == "revision":
+                    session.set_revision(event["i"], event["v"])
+                elif etype == "complete":
+                    session.completed_ns = _parse_iso_ns(event["at"])
+        if session is None:
+            raise ValueError(f"{jsonl_path}: no session header found")
+        session._flushed = len(session._events)  # replayed events are on disk
+        return session
+
+    @classmethod
+    def find_resumable(cls, task: str, config: SessionConfig) -> "Optional[Session]":
+        """Find the newest interrupted session for this exact task + agent
+        configuration whose workspace still exists, or None.
+
+        A session qualifies when its event log has no "complete" event but
+        Phase 0 finished (initial code recorded) — resuming mid-run skips
+        every cycle that already produced a revision.
+        """
+        if not SESSIONS_DIR.is_dir():
+            return None
+        for path in sorted(SESSIONS_DIR.glob("session_*.jsonl"), reverse=True):
+            try:
+                session = cls.load(path)
+            except (OSError, ValueError, json.JSONDecodeError):
+                continue
+            if (
+                session.completed_ns is None
+                and session.task == task
+                and session.config == config
+                and session.initial_code
+                and Path(session.workspace_path).is_dir()
+            ):
+                return session
+        return None
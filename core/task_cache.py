@@ -0,0 +1,59 @@
+"""
+core/task_cache.py
+
+Reuse prior sessions for near-duplicate tasks.
+
+Users re-run close variants of the same task ("write merge sort",
+"implement merge sort in python"). Before paying for a fresh Creator
+phase, look up saved session transcripts whose task is near-identical
+and seed the workspace with their final code.
+
+Similarity is a SequenceMatcher ratio over normalized token sets —
+lowercased alphanumeric words, sorted — which is order- and
+punctuation-insensitive and needs no embedding model or extra
+dependency. The default threshold is deliberately high: a wrong seed
+costs more than a cold start.
+"""
+
+import itertools
+import re
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Optional
+
+from core.session import read_transcript
+
+SESSIONS_DIR = Path(__file__).resolve().parent.parent / "sessions"
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def _normalize(task: str) -> str:
+    return " ".join(sorted(set(_WORD_RE.findall(task.lower()))))
+
+
+def lookup(task: str, threshold: float = 0.92) -> "Optional[tuple[str, str]]":
+    """Return (prior_task, final_code) of the most similar completed
+    session at or above `threshold`, or None when nothing qualifies."""
+    target = _normalize(task)
+    if not target or not SESSIONS_DIR.is_dir():
+        return None
+    best: "Optional[tuple[str, str]]" = None
+    best_score = threshold
+    for path in itertools.chain(
+        SESSIONS_DIR.glob("session_*.json"),
+        SESSIONS_DIR.glob("session_*.json.zst"),
+    ):
+        try:
+            data = read_transcript(path)
+        except (OSError, ValueError):  # unreadable, corrupt, or compressed
+            continue  # without zstandard installed
+        final_code = data.get("final_code", "")
+        prior_task = data.get("task", "")
+        if not final_code or not prior_task:
+            continue
+        score = SequenceMatcher(None, target, _normalize(prior_task)).ratio()
+        if score >= best_score:
+            best_score = score
+            best = (prior_task, final_code)
+    return best
@@ -5,12 +5,27 @@ Manages the shared filesystem workspace for a session.
 All agents read from and write to sessions/<session_id>/workspace/.
 """
 
+import difflib
+import hashlib
+import heapq
+import importlib.util
+import os
 import shutil
+import signal
 import subprocess
+import sys
+import threading
+from collections import deque
 from pathlib import Path
 
+from lru import LRUCache
+
 SESSIONS_DIR = Path(__file__).resolve().parent.parent / "sessions"
 
+# Linux FICLONE ioctl — copy-on-write clone on btrfs/xfs; shares extents
+# until either file is written, so a snapshot costs O(1) bytes.
+_FICLONE = 0x40049409
+
 
 class Workspace:
     """
@@ -35,6 +50,16 @@ class Workspace:
         self.path.mkdir(parents=True, exist_ok=True)
         (self.path / "reviews").mkdir(exist_ok=True)
         (self.path / "snapshots").mkdir(exist_ok=True)
+        # (signature, rendered text) — see manifest()
+        self._manifest_cache: "tuple[tuple[int, int], str] | None" = None
+        # Decoded file contents keyed by (path, mtime_ns, size) — see _read_cached()
+        self._read_cache: LRUCache = LRUCache(capacity=64)
+        # Opt-in parallel test runs: CODEAGENT_XDIST=1 plus pytest-xdist
+        # installed. Checked once; run_tests falls back to serial otherwise.
+        self._xdist_ok = (
+            os.environ.get("CODEAGENT_XDIST") == "1"
+            and importlib.util.find_spec("xdist") is not None
+        )
 
     # ------------------------------------------------------------------ #
     # Fixed file paths
@@ -54,30 +79,77 @@ class Workspace:
     def critique_path(self, cycle: int) -> Path:
         return self.path / "reviews" / f"critique_{cycle}.md"
 
+    def snapshot_path(self, cycle: int) -> Path:
+        return self.path / "snapshots" / f"v{cycle}.py"
+
     # ------------------------------------------------------------------ #
     # Safe readers — return "" if file missing
     # ------------------------------------------------------------------ #
 
+    def _read_cached(self, path: Path) -> str:
+        """Read a workspace file with an LRU memo keyed by (path, mtime_ns, size).
+
+        Agents rewrite files between orchestrator steps, so the stat-based
+        key invalidates naturally: a changed file gets a new key and the
+        stale entry ages out of the LRU. Repeat reads within a step cost
+        one stat instead of an open+read+decode.
+        """
+        try:
+            st = path.stat()
+        except OSError:
+            return ""
+        key = (str(path), st.st_mtime_ns, st.st_size)
+        try:
+            return self._read_cache.get(key)
+        except KeyError:
+            pass
+        try:
+            # read_bytes + one decode skips the text-mode newline layer;
+            # errors="replace" keeps a partially written agent file readable.
+            text = path.read_bytes().decode("utf-8", errors="replace")
+        except OSError:
+            return ""  # deleted between stat and read
+        self._read_cache.put(key, text)
+        return text
+
     def read_solution(self) -> str:
-        return self.solution_path.read_text(encoding="utf-8") if self.solution_path.exists() else ""
+        return self._read_cached(self.solution_path)
+
+    def read_solution_if_changed(self, last_mtime_ns: int = -1) -> "tuple[str | None, int]":
+        """Return (contents, mtime_ns) when solution.py changed since
+        last_mtime_ns; (None, last_mtime_ns) when unchanged or missing.
+
+        Lets the orchestrator skip a full read when an agent call left the
+        file untouched — one stat decides.
+        """
+        try:
+            st = self.solution_path.stat()
+        except OSError:
+            return None, last_mtime_ns
+        if st.st_mtime_ns == last_mtime_ns:
+            return None, last_mtime_ns
+        return self._read_cached(self.solution_path), st.st_mtime_ns
 
     def read_tests(self) -> str:
-        return self.tests_path.read_text(encoding="utf-8") if self.tests_path.exists() else ""
+        return self._read_cached(self.tests_path)
 
     def read_review(self, cycle: int) -> str:
-        p = self.review_path(cycle)
-        return p.read_text(encoding="utf-8") if p.exists() else ""
+        return self._read_cached(self.review_path(cycle))
 
     def read_critique(self, cycle: int) -> str:
-        p = self.critique_path(cycle)
-        return p.read_text(encoding="utf-8") if p.exists() else ""
+        return self._read_cached(self.critique_path(cycle))
 
     # ------------------------------------------------------------------ #
     # Writers
     # ------------------------------------------------------------------ #
 
+    def write_review(self, cycle: int, text: str) -> None:
+        self.review_path(cycle).write_text(text, encoding="utf-8")
+        self._manifest_cache = None  # known local write — drop stale manifest
+
     def write_critique(self, cycle: int, text: str) -> None:
         self.critique_path(cycle).write_text(text, encoding="utf-8")
+        self._manifest_cache = None  # known local write — drop stale manifest
 
     # ------------------------------------------------------------------ #
     # Test runner
@@ -86,50 +158,196 @@ class Workspace:
     def run_tests(self) -> str:
         """
         Run pytest on tests.py in the workspace directory.
-        Returns combined stdout+stderr output.
+        Streams combined stdout+stderr line by line into a bounded tail
+        (last 5000 lines) instead of buffering the whole run in memory.
         Returns a message if tests.py doesn't exist.
         """
         if not self.tests_path.exists():
             return "(no tests.py found in workspace)"
 
+        # sys.executable avoids a PATH lookup and guarantees the
+        # interpreter that has pytest installed; no:cacheprovider
+        # skips .pytest_cache I/O, --no-header/-q trim startup noise,
+        # -x stops at the first failure (the signal the reviewer needs).
+        args = [
+            sys.executable, "-m", "pytest", "tests.py",
+            "-q", "--tb=short", "-p", "no:cacheprovider",
+            "--no-header", "-x",
+        ]
+        # Worker startup only pays off with enough tests to spread around.
+        if self._xdist_ok and self.read_tests().count("def test_") >= 4:
+            args += ["-n", "auto"]
+
+        # Own session so the timeout can kill the whole process group:
+        # xdist workers and subprocesses spawned by agent-written tests
+        # inherit the pipe, and killing only the pytest master would leave
+        # the streaming loop blocked on the open write ends.
         try:
-            result = subprocess.run(
-                ["python", "-m", "pytest", "tests.py", "-v", "--tb=short"],
+            proc = subprocess.Popen(
+                args,
                 cwd=str(self.path),
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                timeout=120,
+                bufsize=1,
+                start_new_session=True,
             )
-            output = result.stdout
-            if result.stderr:
-                output += "\n" + result.stderr
-            return output.strip()
         except FileNotFoundError:
             return "(python not found — cannot run tests)"
-        except subprocess.TimeoutExpired:
+
+        timed_out = False
+
+        def _kill_group() -> None:
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except OSError:
+                proc.kill()  # group already gone — direct kill is a no-op
+
+        def _kill_on_timeout() -> None:
+            nonlocal timed_out
+            timed_out = True
+            _kill_group()
+            try:
+                proc.stdout.close()  # unblock the reader if anything escaped
+            except OSError:
+                pass
+
+        timer = threading.Timer(120, _kill_on_timeout)
+        timer.start()
+        tail: deque = deque(maxlen=5000)
+        try:
+            try:
+                for line in proc.stdout:
+                    tail.append(line.rstrip("\n"))
+            except ValueError:
+                pass  # read end closed by the timeout callback
+            proc.wait()
+        finally:
+            timer.cancel()
+            if proc.poll() is None:
+                _kill_group()
+
+        if timed_out:
             return "(test run timed out after 120s)"
+        return "\n".join(tail).strip()
 
     # ------------------------------------------------------------------ #
     # Snapshot
     # ------------------------------------------------------------------ #
 
     def snapshot(self, cycle: int) -> None:
-        """Copy current solution.py to snapshots/v{cycle}.py before revision."""
-        if self.solution_path.exists():
-            dest = self.path / "snapshots" / f"v{cycle}.py"
-            shutil.copy2(self.solution_path, dest)
+        """Snapshot current solution.py to snapshots/v{cycle}.py before revision.
+
+        Snapshots are deduplicated by content hash: the bytes live once
+        under snapshots/blobs/<blake2b>.py and each v{cycle}.py is a
+        hardlink to its blob, so a no-op revision cycle writes zero new
+        bytes. Hardlinking solution.py itself would be unsafe — agent CLIs
+        rewrite it in place (truncate + write, not rename) — but blobs are
+        written once here and never touched again, so links to them stay
+        immutable.
+        """
+        if not self.solution_path.exists():
+            return
+        data = self.solution_path.read_bytes()
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        blobs_dir = self.path / "snapshots" / "blobs"
+        blobs_dir.mkdir(exist_ok=True)
+        blob = blobs_dir / f"{digest}.py"
+        if not blob.exists():
+            blob.write_bytes(data)
+        dest = self.path / "snapshots" / f"v{cycle}.py"
+        if dest.exists():
+            dest.unlink()  # re-snapshot of the same cycle
+        try:
+            os.link(blob, dest)
+        except OSError:
+            self._clone_or_copy(blob, dest)
+        self._manifest_cache = None  # known local write — drop stale manifest
+
+    def write_solution_diff(self, cycle: int) -> "str | None":
+        """Write a unified diff between the prior and current cycle's
+        snapshots to reviews/diff_{cycle}.patch.
+
+        Returns the workspace-relative path, or None when there is no
+        prior snapshot or the solution is unchanged. Deduplicated
+        snapshots make the unchanged case free: identical content means
+        both v{n}.py files are hardlinks to the same blob, so one inode
+        comparison answers it without reading either file.
+        """
+        prev, curr = self.snapshot_path(cycle - 1), self.snapshot_path(cycle)
+        try:
+            if prev.stat().st_ino == curr.stat().st_ino:
+                return None
+        except OSError:
+            return None  # one of the snapshots is missing
+        lines = list(difflib.unified_diff(
+            self._read_cached(prev).splitlines(keepends=True),
+            self._read_cached(curr).splitlines(keepends=True),
+            fromfile=f"snapshots/v{cycle - 1}.py",
+            tofile=f"snapshots/v{cycle}.py",
+        ))
+        if not lines:
+            return None
+        rel = f"reviews/diff_{cycle}.patch"
+        (self.path / rel).write_text("".join(lines), encoding="utf-8")
+        self._manifest_cache = None  # known local write — drop stale manifest
+        return rel
+
+    @staticmethod
+    def _clone_or_copy(src: Path, dest: Path) -> None:
+        if sys.platform.startswith("linux"):
+            import fcntl
+
+            try:
+                with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+                    fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+                shutil.copystat(src, dest)
+                return
+            except OSError:
+                pass  # filesystem without reflink support — full copy below
+        shutil.copy2(src, dest)
 
     # ------------------------------------------------------------------ #
     # Manifest
     # ------------------------------------------------------------------ #
 
-    def manifest(self) -> str:
-        """Return a text listing of all files in the workspace (for prompts)."""
-        lines = []
-        for p in sorted(self.path.rglob("*")):
-            if p.is_file():
-                rel = p.relative_to(self.path)
-                lines.append(f"  {rel}")
-        if not lines:
-            return "  (workspace is empty)"
-        return "\n".join(lines)
+    def manifest(self, limit: int = 200) -> str:
+        """Return a text listing of workspace files (for prompts), capped
+        at `limit` entries with a trailing "... (+K more)" line beyond that.
+
+        The rendered listing is memoized against a cheap change signature
+        (sum of mtime_ns, file count, limit) collected in the same
+        os.scandir walk, so repeat calls between writes skip the sort and
+        string build. The cap uses heapq.nsmallest — O(n log limit)
+        instead of a full sort — so prompt size and work stay bounded no
+        matter how many snapshots accumulate.
+        """
+        root = str(self.path)
+        prefix_len = len(root) + 1  # strip "<root>/" with a slice, not relpath
+        rel_paths: list[str] = []
+        mtime_sum = 0
+        stack = [root]
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        rel_paths.append(entry.path[prefix_len:])
+                        mtime_sum += entry.stat(follow_symlinks=False).st_mtime_ns
+
+        signature = (mtime_sum, len(rel_paths), limit)
+        if self._manifest_cache is not None and self._manifest_cache[0] == signature:
+            return self._manifest_cache[1]
+
+        omitted = len(rel_paths) - limit
+        if omitted > 0:
+            shown = heapq.nsmallest(limit, rel_paths)
+        else:
+            rel_paths.sort()
+            shown = rel_paths
+        text = "\n".join(f"  {rel}" for rel in shown) or "  (workspace is empty)"
+        if omitted > 0:
+            text += f"\n  ... (+{omitted} more files omitted)"
+        self._manifest_cache = (signature, text)
+        return text
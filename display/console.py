@@ -3,6 +3,11 @@ display/console.py
 
 Rich-based display layer. All visual output is routed through ConsoleDisplay.
 
+rich submodules are imported lazily inside the methods that need them:
+module import then costs nothing, so --help and availability-check-only
+flows skip the ~tens of ms / hundreds of KB that rich.syntax and
+rich.live pull in.
+
 Color conventions:
   cyan    = Creator  (Claude by default)
   green   = Reviewer (Codex by default)
@@ -11,17 +16,16 @@ Color conventions:
   red     = Errors
 """
 
+import queue
+import re
+import threading
 from contextlib import contextmanager
+from functools import lru_cache
 
-from rich.console import Console
-from rich.live import Live
-from rich.panel import Panel
-from rich.rule import Rule
-from rich.spinner import Spinner
-from rich.syntax import Syntax
-from rich.text import Text
-
-_console = Console()
+# One scan per pytest output line: group 1 → failure styling, group 2 →
+# pass styling, no match → dim. First match in the line wins (pytest
+# summaries put "failed" before "passed").
+_TEST_LINE_RE = re.compile(r"(failed|error)|(passed)", re.IGNORECASE)
 
 _CLI_LABELS = {
     "claude": "Claude",
@@ -30,16 +34,62 @@ _CLI_LABELS = {
 }
 
 
+@lru_cache(maxsize=1)
+def _get_console():
+    from rich.console import Console
+
+    return Console()
+
+
 class ConsoleDisplay:
     """Centralised display for all console output."""
 
+    def __init__(self) -> None:
+        # Persistent Live region (mounted via live_session); spinner()
+        # updates it in place instead of installing/uninstalling console
+        # hooks per agent call.
+        self._live = None
+        # Background panel renderer (started on first agent_output):
+        # Pygments highlighting of large outputs runs off the orchestrator
+        # thread, overlapping with the next agent's subprocess wait.
+        self._render_q: "queue.Queue | None" = None
+
+    def _ensure_renderer(self) -> "queue.Queue":
+        if self._render_q is None:
+            self._render_q = queue.Queue()
+            thread = threading.Thread(
+                target=self._render_worker, daemon=True, name="display-render"
+            )
+            thread.start()
+        return self._render_q
+
+    def _render_worker(self) -> None:
+        while True:
+            kwargs = self._render_q.get()
+            try:
+                self._render_agent_output(**kwargs)
+            except Exception as exc:  # keep the renderer alive for later panels
+                _get_console().print(f"[red]render error:[/red] {exc}")
+            finally:
+                self._render_q.task_done()
+
+    def _flush(self) -> None:
+        """Block until queued panels are printed — called before any direct
+        print so output order matches the orchestration order."""
+        if self._render_q is not None:
+            self._render_q.join()
+
     # ------------------------------------------------------------------ #
     # Structural elements
     # ------------------------------------------------------------------ #
 
     def header(self, task: str, iterations: int) -> None:
-        _console.print()
-        _console.print(
+        self._flush()
+        from rich.panel import Panel
+
+        console = _get_console()
+        console.print()
+        console.print(
             Panel(
                 f"[bold white]Multi-Agent Code Generator[/bold white]\n"
                 f'[dim]Task:[/dim] [yellow]{task}[/yellow]   '
@@ -48,20 +98,27 @@ class ConsoleDisplay:
                 padding=(1, 2),
             )
         )
-        _console.print()
+        console.print()
 
     def phase_header(self, label: str, phase: int, total: int) -> None:
+        self._flush()
+        from rich.rule import Rule
+
+        console = _get_console()
         if phase == 0:
-            _console.print(Rule(f"  Phase 0 — {label}  ", style="yellow"))
+            console.print(Rule(f"  Phase 0 — {label}  ", style="yellow"))
         else:
-            _console.print(Rule(f"  Cycle {phase}/{total} — {label}  ", style="yellow"))
-        _console.print()
+            console.print(Rule(f"  Cycle {phase}/{total} — {label}  ", style="yellow"))
+        console.print()
 
     def section(self, label: str) -> None:
-        _console.print(Rule(f" {label} ", style="dim"))
+        self._flush()
+        from rich.rule import Rule
+
+        _get_console().print(Rule(f" {label} ", style="dim"))
 
     def blank(self) -> None:
-        _console.print()
+        _get_console().print()
 
     # ------------------------------------------------------------------ #
     # Agent output panels
@@ -76,6 +133,24 @@ class ConsoleDisplay:
         is_code: bool,
         label: str = "",
     ) -> None:
+        """Queue a panel for the background renderer and return immediately."""
+        self._ensure_renderer().put(
+            dict(role=role, color=color, cli=cli, content=content,
+                 is_code=is_code, label=label)
+        )
+
+    def _render_agent_output(
+        self,
+        role: str,
+        color: str,
+        cli: str,
+        content: str,
+        is_code: bool,
+        label: str = "",
+    ) -> None:
+        from rich.panel import Panel
+        from rich.text import Text
+
         display_name = _CLI_LABELS.get(cli, cli)
         title = f" {role} ({display_name})"
         if label:
@@ -83,6 +158,8 @@ class ConsoleDisplay:
         title += " "
 
         if is_code:
+            from rich.syntax import Syntax
+
             renderable = Syntax(
                 content,
                 "python",
@@ -93,7 +170,8 @@ class ConsoleDisplay:
         else:
             renderable = Text(content, overflow="fold")
 
-        _console.print(
+        console = _get_console()
+        console.print(
             Panel(
                 renderable,
                 title=title,
@@ -102,11 +180,15 @@ class ConsoleDisplay:
                 padding=(1, 2),
             )
         )
-        _console.print()
+        console.print()
 
     def agent_error(self, role: str, cli: str, message: str) -> None:
+        self._flush()
+        from rich.panel import Panel
+        from rich.text import Text
+
         display_name = _CLI_LABELS.get(cli, cli)
-        _console.print(
+        _get_console().print(
             Panel(
                 Text(message, style="red"),
                 title=f" Error — {role} ({display_name}) ",
@@ -121,13 +203,13 @@ class ConsoleDisplay:
     # ------------------------------------------------------------------ #
 
     def tool_found(self, name: str, binary: str, path: str) -> None:
-        _console.print(
+        _get_console().print(
             f"  [bold green]FOUND[/bold green]   {name} "
             f"([cyan]{binary}[/cyan])  [dim]{path}[/dim]"
         )
 
     def tool_missing(self, name: str, binary: str, install_hint: str) -> None:
-        _console.print(
+        _get_console().print(
             f"  [bold red]MISSING[/bold red]  {name} ([cyan]{binary}[/cyan])\n"
             f"            Install: [dim]{install_hint}[/dim]"
         )
@@ -136,41 +218,90 @@ class ConsoleDisplay:
     # Spinner context manager
     # ------------------------------------------------------------------ #
 
+    @contextmanager
+    def live_session(self):
+        """Mount one Live region for the duration of an orchestrator run.
+
+        Entering/exiting Live installs and removes console render hooks;
+        doing that once per run instead of once per agent call keeps
+        redraws smooth across the ~3×N spinner phases.
+        """
+        from rich.live import Live
+        from rich.text import Text
+
+        live = Live(Text(""), console=_get_console(), refresh_per_second=10, transient=True)
+        self._live = live
+        try:
+            with live:
+                yield
+        finally:
+            self._live = None
+
     @contextmanager
     def spinner(self, text: str, color: str = "white"):
         """Display a spinner while a block executes."""
+        from rich.spinner import Spinner
+
         spinner_obj = Spinner("dots", text=f"[{color}]{text}[/{color}]")
-        with Live(spinner_obj, console=_console, refresh_per_second=10, transient=True):
-            yield
+        live = self._live
+        if live is not None:
+            from rich.text import Text
+
+            live.update(spinner_obj)
+            try:
+                yield
+            finally:
+                live.update(Text(""))
+        else:
+            # No mounted region (direct callers outside live_session):
+            # fall back to a one-shot Live as before.
+            from rich.live import Live
+
+            with Live(spinner_obj, console=_get_console(), refresh_per_second=10, transient=True):
+                yield
 
     # ------------------------------------------------------------------ #
     # Terminal messages
     # ------------------------------------------------------------------ #
 
     def error(self, message: str) -> None:
-        _console.print(f"\n[bold red]Error:[/bold red] {message}\n")
+        self._flush()
+        _get_console().print(f"\n[bold red]Error:[/bold red] {message}\n")
 
     def success(self, message: str) -> None:
-        _console.print(f"[bold green]✓[/bold green] {message}")
+        self._flush()
+        _get_console().print(f"[bold green]✓[/bold green] {message}")
 
     def test_results(self, output: str) -> None:
         """Display pytest output in a yellow panel with pass/fail highlighting."""
-        lines = output.splitlines()
+        self._flush()
+        from rich.panel import Panel
+        from rich.text import Text
+
         text = Text()
-        for line in lines:
-            line_lower = line.lower()
-            if "failed" in line_lower or "error" in line_lower:
-                text.append(line + "\n", style="bold red")
-            elif "passed" in line_lower or "passed" in line_lower:
-                text.append(line + "\n", style="bold green")
-            elif line.startswith("PASSED") or " PASSED" in line:
-                text.append(line + "\n", style="dim green")
-            elif line.startswith("FAILED") or " FAILED" in line:
-                text.append(line + "\n", style="red")
+        search = _TEST_LINE_RE.search
+        # Batch consecutive same-style lines into a single append each
+        # instead of one Text segment per line.
+        run_style = "dim"
+        run_lines: list = []
+        for line in output.splitlines():
+            match = search(line)
+            if match is None:
+                style = "dim"
+            elif match.lastindex == 1:
+                style = "bold red"
             else:
-                text.append(line + "\n", style="dim")
+                style = "bold green"
+            if style != run_style and run_lines:
+                text.append("".join(run_lines), style=run_style)
+                run_lines.clear()
+            run_style = style
+            run_lines.append(line + "\n")
+        if run_lines:
+            text.append("".join(run_lines), style=run_style)
 
-        _console.print(
+        console = _get_console()
+        console.print(
             Panel(
                 text,
                 title=" Test Results ",
@@ -179,13 +310,19 @@ class ConsoleDisplay:
                 padding=(0, 2),
             )
         )
-        _console.print()
+        console.print()
 
     def done(self, final_code: str) -> None:
         """Print the final code summary panel."""
-        _console.print(Rule(" Final Output ", style="bold green"))
-        _console.print()
-        _console.print(
+        self._flush()
+        from rich.panel import Panel
+        from rich.rule import Rule
+        from rich.syntax import Syntax
+
+        console = _get_console()
+        console.print(Rule(" Final Output ", style="bold green"))
+        console.print()
+        console.print(
             Panel(
                 Syntax(
                     final_code,
@@ -200,4 +337,4 @@ class ConsoleDisplay:
                 padding=(1, 2),
             )
         )
-        _console.print()
+        console.print()
@@ -17,10 +17,11 @@ from pathlib import Path
 from agents import create_agents, TOOL_MAP
 from core.availability import verify_all_tools, AvailabilityError
 from core.orchestrator import Orchestrator, OrchestratorError
+from core.session import Session, SessionConfig
 from display.console import ConsoleDisplay
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv=None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         prog="multi-code-agent",
         description="Multi-agent coding system: Creator builds, Reviewer critiques, Critic challenges.",
@@ -32,7 +33,11 @@ Examples:
   python main.py "build a rate limiter" --creator gemini --reviewer claude --critic openai
         """,
     )
-    parser.add_argument("task", help='The coding task to solve, e.g. "write a binary search"')
+    parser.add_argument(
+        "task",
+        nargs="?",
+        help='The coding task to solve, e.g. "write a binary search"',
+    )
     parser.add_argument(
         "--creator",
         choices=["claude", "openai", "gemini"],
@@ -75,18 +80,31 @@ Examples:
         metavar="SECONDS",
         help="Per-agent call timeout in seconds (default: 120)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the response cache and always invoke the CLIs",
+    )
     parser.add_argument(
         "--no-save",
         action="store_true",
         help="Do not save the session transcript to ./sessions/",
     )
-    return parser.parse_args()
-
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Run as a daemon: accept argv over a UNIX socket ($MCA_SOCKET, "
+        "default /tmp/mca.sock) and run tasks in-process, skipping "
+        "interpreter startup and imports per invocation",
+    )
+    args = parser.parse_args(argv)
+    if args.task is None and not args.serve:
+        parser.error("the task argument is required unless --serve is given")
+    return args
 
-def main() -> None:
-    args = parse_args()
-    display = ConsoleDisplay()
 
+def run(args: argparse.Namespace, display: ConsoleDisplay) -> None:
+    """Execute one parsed invocation end to end (the pre-daemon main body)."""
     # Determine the set of CLI binaries needed (may be fewer than 3 if roles share an agent)
     required_binaries = {TOOL_MAP[args.creator], TOOL_MAP[args.reviewer], TOOL_MAP[args.critic]}
 
@@ -104,6 +122,7 @@ def main() -> None:
         critic_key=args.critic,
         timeout=args.timeout,
         display=display,
+        use_cache=not args.no_cache,
     )
 
     # Run the orchestrated loop
@@ -114,8 +133,24 @@ def main() -> None:
             critic=critic,
             iterations=args.iterations,
             display=display,
+            autosave=not args.no_save,
+            reuse_sessions=not args.no_cache,
         )
-        session = orchestrator.run(task=args.task)
+        # A crashed run leaves an incomplete event log behind; rerunning the
+        # same task with the same agents picks up after the last finished
+        # cycle instead of paying for Phase 0 and the completed cycles again.
+        resume = None
+        if not args.no_save:
+            resume = Session.find_resumable(
+                task=args.task,
+                config=SessionConfig(
+                    creator=TOOL_MAP[args.creator],
+                    reviewer=TOOL_MAP[args.reviewer],
+                    critic=TOOL_MAP[args.critic],
+                    iterations=args.iterations,
+                ),
+            )
+        session = orchestrator.run(task=args.task, resume=resume)
     except OrchestratorError as exc:
         display.error(f"Orchestration failed: {exc}")
         sys.exit(1)
@@ -139,5 +174,64 @@ def main() -> None:
         display.success(f"Session saved to: {saved_path}")
 
 
+def serve(display: ConsoleDisplay) -> None:
+    """Daemon mode: run invocations in-process over a UNIX socket.
+
+    Batch drivers (CI matrices, benchmark sweeps) invoking main.py
+    hundreds of times pay interpreter startup plus imports (~300ms)
+    per run. --serve loads everything once; each connection sends one
+    JSON argv array (e.g. `["write merge sort", "--iterations", "2"]`)
+    and receives the run's exit code as a single line. Display output
+    stays on the daemon's terminal.
+
+        echo '["write merge sort"]' | nc -U /tmp/mca.sock
+    """
+    import json
+    import os
+    import socket
+
+    sock_path = os.environ.get("MCA_SOCKET", "/tmp/mca.sock")
+    try:
+        os.unlink(sock_path)
+    except FileNotFoundError:
+        pass
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(sock_path)
+    server.listen()
+    display.success(f"Serving on {sock_path} — one JSON argv array per connection")
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                code = 0
+                try:
+                    argv = json.loads(conn.makefile("rb").read())
+                    run(parse_args(argv), display)
+                except SystemExit as exc:  # parse_args error or run() sys.exit
+                    code = int(exc.code or 0)
+                except Exception as exc:
+                    display.error(f"Request failed: {exc}")
+                    code = 1
+                try:
+                    conn.sendall(f"{code}\n".encode())
+                except OSError:
+                    pass  # client went away — keep serving
+    finally:
+        server.close()
+        try:
+            os.unlink(sock_path)
+        except FileNotFoundError:
+            pass
+
+
+def main() -> None:
+    args = parse_args()
+    display = ConsoleDisplay()
+    if args.serve:
+        serve(display)
+    else:
+        run(args, display)
+
+
 if __name__ == "__main__":
     main()
@@ -12,23 +12,27 @@ Phases:
 Workspace-aware design: agents operate in a shared filesystem workspace.
 - Creator writes solution.py, tests.py, runs tests directly.
 - Reviewer reads files and runs tests autonomously.
-- Critic receives code+review inline (most reliable across CLIs).
+- Critic reads solution and review from the workspace by file reference
+  (all supported CLIs can read files; inlining both re-encoded them into
+  every prompt and grew the context superlinearly across cycles).
+
+Prefix-cache layout: every prompt opens with a static block (persona +
+instructions, hoisted to the module constants below) and puts the dynamic
+fields — task, cycle, manifest — at the tail. Providers hash leading
+bytes for prompt caching, so repeated calls of the same phase share the
+expensive prefix as long as it is byte-identical; keep edits to these
+constants deliberate.
 """
 
+from functools import lru_cache
 from typing import Optional
 
+# --------------------------------------------------------------------- #
+# Static prompt prefixes (byte-identical across calls of the same phase)
+# --------------------------------------------------------------------- #
 
-class PromptBuilder:
-    """Builds prompts for each agent role and phase."""
-
-    # ------------------------------------------------------------------ #
-    # CREATOR — Initial
-    # ------------------------------------------------------------------ #
-
-    def creator_initial(self, task: str) -> str:
-        return f"""You are an expert software engineer. Your job is to implement a solution and tests for the following task.
-
-TASK: {task}
+_CREATOR_INITIAL_STATIC = """\
+You are an expert software engineer. Your job is to implement a solution and tests for the task stated at the end of this prompt.
 
 WORKSPACE INSTRUCTIONS:
 You are operating in a shared workspace directory. Perform these steps in order:
@@ -55,23 +59,17 @@ You are operating in a shared workspace directory. Perform these steps in order:
 COMPLEXITY NOTE: If this task has independent components (e.g. separate modules, a core class + utilities + tests), consider using the Task tool to develop them in parallel for speed.
 """
 
-    # ------------------------------------------------------------------ #
-    # CREATOR — Revision
-    # ------------------------------------------------------------------ #
-
-    def creator_revision(self, task: str, cycle: int) -> str:
-        return f"""You are an expert software engineer revising Python code based on structured feedback.
-
-ORIGINAL TASK: {task}
+_CREATOR_REVISION_STATIC = """\
+You are an expert software engineer revising Python code based on structured feedback.
 
-WORKSPACE INSTRUCTIONS (revision cycle {cycle}):
+WORKSPACE INSTRUCTIONS:
 You are operating in a shared workspace directory. Perform these steps in order:
 
 1. Read the current state:
    - `solution.py` — the code to revise
    - `tests.py` — the test suite
-   - `reviews/review_{cycle}.md` — the reviewer's feedback
-   - `reviews/critique_{cycle}.md` — the critic's perspective on the review
+   - the reviewer's feedback and the critic's perspective on it
+     (exact paths under CURRENT CYCLE at the end of this prompt)
 
 2. Apply revisions to `solution.py`:
    - Fix real bugs and security issues identified in the review
@@ -91,17 +89,8 @@ You are operating in a shared workspace directory. Perform these steps in order:
 5. Write a brief summary of what you changed to stdout (a few bullet points).
 """
 
-    # ------------------------------------------------------------------ #
-    # REVIEWER — Initial (cycle 1)
-    # ------------------------------------------------------------------ #
-
-    def reviewer_initial(self, task: str, manifest: str) -> str:
-        return f"""You are a senior software engineer performing a code review.
-
-TASK CONTEXT: The code was written to solve: {task}
-
-WORKSPACE FILES:
-{manifest}
+_REVIEWER_INITIAL_STATIC = """\
+You are a senior software engineer performing a code review.
 
 INSTRUCTIONS:
 1. Read `solution.py` and `tests.py` from the workspace.
@@ -138,32 +127,24 @@ INSTRUCTIONS:
 Be objective. If the code is genuinely good, say so. Do not invent problems.
 """
 
-    # ------------------------------------------------------------------ #
-    # REVIEWER — Update (cycle 2+)
-    # ------------------------------------------------------------------ #
+_REVIEWER_UPDATE_STATIC = """\
+You are a senior software engineer performing an updated code review.
 
-    def reviewer_update(self, task: str, manifest: str, cycle: int) -> str:
-        prior = cycle - 1
-        return f"""You are a senior software engineer performing an updated code review.
-
-TASK CONTEXT: {task}
-
-The code has been revised based on feedback from cycle {prior}. A critic also evaluated your last review.
-
-WORKSPACE FILES:
-{manifest}
+The code has been revised based on your feedback from the prior cycle. A critic also
+evaluated your last review. Cycle numbers and paths are under CURRENT CYCLE at the
+end of this prompt.
 
 INSTRUCTIONS:
 1. Read the revised `solution.py` and `tests.py`.
 
-2. Read your previous review at `reviews/review_{prior}.md` and the critic's evaluation at `reviews/critique_{prior}.md`.
+2. Read your previous review and the critic's evaluation of it (paths below).
 
 3. Run the test suite:
    ```
    python -m pytest tests.py -v --tb=long 2>&1 | tee test_run_reviewer.txt
    ```
 
-4. Write your updated review to `reviews/review_{cycle}.md` with this structure:
+4. Write your updated review (output path below) with this structure:
 
    ## 1. TEST RESULTS
    Paste the test run summary.
@@ -184,38 +165,8 @@ INSTRUCTIONS:
    - Remaining MUST-FIX issues
 """
 
-    # ------------------------------------------------------------------ #
-    # CRITIC — Single phase
-    # ------------------------------------------------------------------ #
-
-    def critic(
-        self,
-        task: str,
-        solution_code: str,
-        review_text: str,
-        cycle: int,
-        prior_critique: Optional[str] = None,
-    ) -> str:
-        prior_section = ""
-        if prior_critique:
-            prior_section = f"""
-YOUR PREVIOUS CRITIQUE (cycle {cycle - 1}):
-{prior_critique}
-
-Consider whether the issues you raised previously were addressed in the revised code.
-
-"""
-        return f"""You are a principal engineer acting as a critical second opinion on a code review.
-
-TASK CONTEXT: The code was written to solve: {task}
-{prior_section}
-THE CODE THAT WAS REVIEWED (solution.py):
-```python
-{solution_code}
-```
-
-THE REVIEW YOU ARE EVALUATING (reviews/review_{cycle}.md):
-{review_text}
+_CRITIC_STATIC = """\
+You are a principal engineer acting as a critical second opinion on a code review.
 
 Your job is NOT to re-review the code. Your job is to critically evaluate the REVIEW ITSELF.
 
@@ -242,3 +193,117 @@ List at most 5 concrete, ranked action items — synthesizing both the review's
 
 Be direct and honest. A good critic improves the quality of the feedback loop.
 """
+
+
+class PromptBuilder:
+    """Builds prompts for each agent role and phase.
+
+    Every method is a pure function of hashable arguments, so renders are
+    memoized: identical calls (retries, resumed runs, repeat cycles over
+    an unchanged manifest) reuse the built string. Use the module-level
+    DEFAULT_BUILDER so all callers share one memo.
+    """
+
+    # ------------------------------------------------------------------ #
+    # CREATOR — Initial
+    # ------------------------------------------------------------------ #
+
+    @lru_cache(maxsize=128)
+    def creator_initial(self, task: str) -> str:
+        return f"""{_CREATOR_INITIAL_STATIC}
+TASK: {task}
+"""
+
+    # ------------------------------------------------------------------ #
+    # CREATOR — Revision
+    # ------------------------------------------------------------------ #
+
+    @lru_cache(maxsize=128)
+    def creator_revision(self, task: str, cycle: int) -> str:
+        return f"""{_CREATOR_REVISION_STATIC}
+CURRENT CYCLE: {cycle}
+- Reviewer's feedback: `reviews/review_{cycle}.md`
+- Critic's perspective: `reviews/critique_{cycle}.md`
+
+ORIGINAL TASK: {task}
+"""
+
+    # ------------------------------------------------------------------ #
+    # REVIEWER — Initial (cycle 1)
+    # ------------------------------------------------------------------ #
+
+    @lru_cache(maxsize=128)
+    def reviewer_initial(self, task: str, manifest: str) -> str:
+        return f"""{_REVIEWER_INITIAL_STATIC}
+TASK CONTEXT: The code was written to solve: {task}
+
+WORKSPACE FILES:
+{manifest}
+"""
+
+    # ------------------------------------------------------------------ #
+    # REVIEWER — Update (cycle 2+)
+    # ------------------------------------------------------------------ #
+
+    @lru_cache(maxsize=128)
+    def reviewer_update(self, task: str, manifest: str, cycle: int) -> str:
+        prior = cycle - 1
+        return f"""{_REVIEWER_UPDATE_STATIC}
+CURRENT CYCLE: {cycle}
+- Your previous review: `reviews/review_{prior}.md`
+- The critic's evaluation of it: `reviews/critique_{prior}.md`
+- Write your updated review to: `reviews/review_{cycle}.md`
+
+TASK CONTEXT: {task}
+
+WORKSPACE FILES:
+{manifest}
+"""
+
+    # ------------------------------------------------------------------ #
+    # CRITIC — Single phase
+    # ------------------------------------------------------------------ #
+
+    @lru_cache(maxsize=128)
+    def critic(
+        self,
+        task: str,
+        cycle: int,
+        solution_ref: str = "solution.py",
+        review_ref: Optional[str] = None,
+        prior_critique_ref: Optional[str] = None,
+        diff_ref: Optional[str] = None,
+    ) -> str:
+        """Critic prompt referencing workspace files instead of inlining them.
+
+        The critic runs with cwd set to the workspace, so it reads
+        `solution_ref` and `review_ref` itself — the prompt stays O(1) in
+        size no matter how large the solution and review grow. On cycles
+        with a `diff_ref`, the critic is pointed at a unified diff of the
+        last revision so its fresh analysis concentrates on changed code.
+        """
+        review_ref = review_ref or f"reviews/review_{cycle}.md"
+        prior_section = ""
+        if prior_critique_ref:
+            prior_section = f"""
+YOUR PREVIOUS CRITIQUE (cycle {cycle - 1}) is at `{prior_critique_ref}`. Read it and
+consider whether the issues you raised previously were addressed in the revised code.
+"""
+        diff_section = ""
+        if diff_ref:
+            diff_section = f"""
+CHANGES THIS CYCLE: `{diff_ref}` is a unified diff of what changed in the last
+revision. Start your own analysis from the changed hunks — unchanged code was
+already examined in earlier cycles.
+"""
+        return f"""{_CRITIC_STATIC}
+You are operating in a shared workspace directory. Read these files first:
+- `{solution_ref}` — the code that was reviewed
+- `{review_ref}` — the review you are evaluating
+{prior_section}{diff_section}
+TASK CONTEXT: The code was written to solve: {task}
+"""
+
+
+# Shared builder: one memo for the whole process.
+DEFAULT_BUILDER = PromptBuilder()
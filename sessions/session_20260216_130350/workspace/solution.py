@@ -5,6 +5,29 @@ A palindrome is a string that reads the same forwards and backwards,
 ignoring case and non-alphanumeric characters (by default).
 """
 
+import string
+
+# Optional NumPy fast path for long ASCII inputs: the filtering,
+# lowercasing and reversed comparison all run as vectorized C loops.
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+if _np is not None:
+    _ALNUM_LUT = _np.zeros(256, dtype=_np.bool_)
+    _ALNUM_LUT[[ord(c) for c in string.ascii_letters + string.digits]] = True
+
+# Below this length the two-pointer loop wins; above it, NumPy's setup
+# cost is amortized and throughput is memory-bound.
+_VECTOR_MIN_LEN = 4096
+
+# Precomputed alphanumeric test for the ASCII range. Indexing a bytes
+# object yields a plain int (no str.isalnum() call, no Unicode category
+# lookup), which is the common case for real-world input; code points
+# >= 128 fall back to the full Unicode test.
+_ASCII_ALNUM = bytes(int(chr(i).isalnum()) for i in range(128))
+
 
 def is_palindrome(s: str, strict: bool = False) -> bool:
     """
@@ -43,9 +66,35 @@ def is_palindrome(s: str, strict: bool = False) -> bool:
         # Exact comparison: case-sensitive, all characters matter
         return s == s[::-1]
 
-    # Normalise: lowercase and keep only alphanumeric characters
-    filtered = "".join(ch.lower() for ch in s if ch.isalnum())
-    return filtered == filtered[::-1]
+    if _np is not None and len(s) > _VECTOR_MIN_LEN and s.isascii():
+        buf = _np.frombuffer(s.encode("ascii"), dtype=_np.uint8)
+        kept = buf[_ALNUM_LUT[buf]]  # fancy indexing copies → writable
+        upper = (kept >= 65) & (kept <= 90)
+        kept[upper] |= 0x20  # ASCII lowercase: set bit 5 on letters only
+        return bool(_np.array_equal(kept, kept[::-1]))
+
+    # Two-pointer scan over the raw string: skip non-alphanumeric characters
+    # in place and compare case-folded ends. One pass, no intermediate
+    # strings, and an early exit on the first mismatch. The LUT answers
+    # the alnum test for ASCII without a method call per character.
+    lut = _ASCII_ALNUM
+    i, j = 0, len(s) - 1
+    while i < j:
+        a = s[i]
+        o = ord(a)
+        if not (lut[o] if o < 128 else a.isalnum()):
+            i += 1
+            continue
+        b = s[j]
+        o = ord(b)
+        if not (lut[o] if o < 128 else b.isalnum()):
+            j -= 1
+            continue
+        if a.lower() != b.lower():
+            return False
+        i += 1
+        j -= 1
+    return True
 
 
 if __name__ == "__main__":
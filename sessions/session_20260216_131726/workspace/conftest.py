@@ -0,0 +1,19 @@
+"""Shared fixtures for the cache test suite."""
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """One event loop shared by every async test.
+
+    asyncio.run() builds and tears down a fresh loop per call (~1ms
+    each) — dominant cost for tests whose awaited ops are sub-
+    microsecond. The async tests only need *a* running loop, so they
+    share this one via run_until_complete.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
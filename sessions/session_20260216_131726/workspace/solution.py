@@ -2,25 +2,34 @@
 Thread-safe LRU Cache with TTL Expiry and Async Support.
 
 Provides a doubly-linked list + hash map LRU eviction policy,
-per-entry TTL expiration, thread safety via RLock, async-compatible
+per-entry TTL expiration, thread safety via a plain Lock, async-compatible
 get/set methods (async wrappers around the sync core), and
 hit/miss statistics tracking.
 """
 
 import asyncio
+import sys
 import threading
 import time
-from collections import OrderedDict
+import weakref
 from dataclasses import dataclass
-from typing import Any, Generic, Hashable, Optional, TypeVar
+from typing import Any, Generic, Hashable, NamedTuple, Optional, TypeVar
 
 K = TypeVar("K", bound=Hashable)
 V = TypeVar("V")
 
+# Sentinel for "no MRU hint". None cannot serve: it is a legitimate cache
+# key, and treating it as "unknown" would skip the promotion of a stored
+# None key (or promote nothing after the hint is reset), corrupting the
+# recency order.
+_UNSET = object()
 
-@dataclass
-class CacheStats:
-    """Snapshot of cache hit/miss counters."""
+
+# NamedTuple rather than a dataclass: snapshots are allocated on every
+# stats() call in metrics loops, and tuples are created faster, are
+# immutable, and carry no per-instance __dict__.
+class CacheStats(NamedTuple):
+    """Immutable snapshot of cache hit/miss counters."""
     hits: int = 0
     misses: int = 0
     evictions: int = 0
@@ -43,17 +52,61 @@ class CacheStats:
         )
 
 
-@dataclass
+# slots=True drops the per-instance __dict__ (~2x smaller entries on a
+# large cache) and makes every field a fixed-offset slot load. prev/next
+# make the entry an intrusive node in the recency list, so promotion and
+# eviction relink entries directly instead of going through a container.
+@dataclass(slots=True)
 class _Entry:
-    """Internal cache entry storing value, expiry timestamp, and access order."""
+    """Internal cache entry: key, value, expiry, and recency-list links."""
+    key: Any
     value: Any
-    # Absolute expiry time from time.monotonic(); None means no expiry.
-    expires_at: Optional[float]
+    # Absolute expiry time in time.monotonic_ns() nanoseconds; 0 means no
+    # expiry. An int sentinel keeps is_expired a branch plus an integer
+    # compare — no None check, no float unboxing — on the hottest path.
+    expires_at: int
+    prev: "Optional[_Entry]" = None
+    next: "Optional[_Entry]" = None
+    # Reference bit for policy="clock": set on access, cleared when the
+    # eviction sweep grants the entry its second chance. Unused (always
+    # False) under the default LRU policy.
+    referenced: bool = False
+
+    def is_expired(self, now_ns: int) -> bool:
+        """True if the entry is past its expiry at clock reading *now_ns*."""
+        return self.expires_at != 0 and now_ns >= self.expires_at
+
+
+class _StripedCounter:
+    """LongAdder-style striped counter for ``striped_stats=True``.
+
+    Each thread increments a cell chosen by hashing its thread id, so
+    concurrent writers mostly touch distinct cache lines instead of
+    bouncing one shared int; ``int()`` sums the cells. Implements
+    ``__iadd__`` so every ``counter += n`` site in the cache works
+    identically whether the counter is a plain int or striped.
+    """
+
+    __slots__ = ("_cells",)
+
+    def __init__(self) -> None:
+        # 64 cells, strided 8 apart: the list's item array packs 8
+        # pointers per 64-byte line, so the stride gives each hot cell
+        # its own line of that array.
+        self._cells = [0] * (64 * 8)
+
+    def __iadd__(self, n: int) -> "_StripedCounter":
+        # Fibonacci-mix the thread id before masking: raw idents are
+        # pointer-aligned pthread addresses whose low bits are identical
+        # across threads, so a plain `ident & 63` maps everyone to one
+        # cell.
+        self._cells[(threading.get_ident() * 0x9E3779B97F4A7C15 >> 58 & 63) * 8] += n
+        return self
 
-    def is_expired(self) -> bool:
-        if self.expires_at is None:
-            return False
-        return time.monotonic() >= self.expires_at
+    def __int__(self) -> int:
+        # Plain sum, no lock: each element load is GIL-atomic, matching
+        # the lock-free stats() contract.
+        return sum(self._cells)
 
 
 class LRUCache(Generic[K, V]):
@@ -67,17 +120,99 @@ class LRUCache(Generic[K, V]):
     default_ttl : float | None
         Default time-to-live in seconds for entries that do not specify one.
         ``None`` (default) means entries never expire unless explicitly set.
+    ttl_resolution : float
+        Clock granularity in seconds for TTL checks. ``0`` (default) reads
+        ``time.monotonic()`` on every operation for exact expiry. A positive
+        value caches the clock and refreshes it from a background daemon
+        thread every ``ttl_resolution`` seconds, removing the clock read
+        from every ``get``/``set`` at the cost of entries expiring up to
+        ``ttl_resolution`` seconds late (the same trade-off as
+        node-lru-cache's ``ttlResolution`` or memcached's cached
+        ``current_time``). Only worthwhile for very hot caches.
+    purge_interval : float
+        Minimum seconds between effective ``purge_stale()`` sweeps. Calls
+        arriving sooner return immediately, so hot paths may invoke
+        ``purge_stale()`` opportunistically without paying a full walk
+        each time. ``0`` (default) never dampens the sweep.
+    lazy_expire : bool
+        ``True`` (default): ``get``/``contains`` check TTL on every access
+        and drop stale entries on the spot. ``False``: accesses skip the
+        expiry branch entirely and stale entries survive — and are
+        returned — until the next ``purge_stale()`` sweep. Only choose
+        ``False`` when serving a slightly-stale value is acceptable and
+        a periodic sweep is in place.
+    active_expire : bool
+        ``False`` (default): expired entries are only reclaimed on access
+        or via ``purge_stale()``, so untouched stale entries keep their
+        memory. ``True``: entries with a TTL are also filed into a hashed
+        timing wheel and a daemon thread reclaims each slot as the hand
+        passes it, bounding how long expired bytes stay resident to about
+        one ``wheel_slot_s`` (plus one wheel revolution for TTLs longer
+        than ``wheel_size * wheel_slot_s``, which are re-filed on pass).
+    wheel_size : int
+        Number of wheel slots (default 3600). With the default 1s slots
+        the wheel spans an hour per revolution.
+    wheel_slot_s : float
+        Slot duration in seconds (default 1.0) — both the hand's advance
+        period and the expiry-lateness bound for active reclamation.
+    no_ttl : bool
+        ``True`` promises that no entry will ever carry a TTL (requires
+        ``default_ttl=None``; ``set(..., ttl=...)`` then raises
+        ValueError). In exchange, ``get``/``set`` are rebound at
+        construction to specialized implementations with every expiry
+        branch removed from the hot path. Purely an optimization: the
+        observable behavior matches a TTL-capable cache that never
+        expires anything.
+    eviction_batch : int
+        Number of LRU entries evicted together when a new key arrives at
+        capacity (default 1, clamped to ``capacity``). Values > 1 leave
+        headroom so a write-thrashing cache amortizes eviction
+        bookkeeping over the next ``eviction_batch`` inserts, at the
+        cost of briefly running below capacity. Size never exceeds
+        ``capacity``: the batch is evicted before the insert.
+    policy : str
+        Replacement policy. ``"lru"`` (default) relinks the accessed
+        entry to the recency-list front on every hit. ``"clock"``
+        (second chance) instead sets a per-entry reference bit on
+        access — a single slot write, no list mutation — and moves the
+        ordering work to eviction: the sweep walks from the list tail,
+        clearing bits and re-queueing referenced entries until it finds
+        an unreferenced victim. Approximates LRU closely on skewed
+        workloads while keeping the read critical section minimal;
+        incompatible with ``no_ttl=True``.
+    striped_stats : bool
+        ``False`` (default): statistics counters are plain ints — the
+        locked increments never contend under the GIL. ``True``:
+        counters become LongAdder-style striped cells indexed by a hash
+        of the thread id, so concurrent writers stop sharing one cache
+        line (relevant on free-threaded builds) and the lock-free
+        ``get_unsafe`` counters become near-exact instead of lossy.
+        Costs ~150ns per operation for the thread-id hash, hence opt-in.
+    intern_keys : bool
+        ``True``: string keys are passed through ``sys.intern`` on every
+        operation, so keys rebuilt per call (the ``f"key{i}"`` pattern)
+        resolve to one canonical object and the dict probe's equality
+        check short-circuits on pointer identity instead of comparing
+        characters. Only worthwhile when the same textual keys recur;
+        non-string keys are untouched. Default ``False``.
 
     Thread safety
     -------------
-    All public synchronous methods are protected by a reentrant lock so the
-    cache can be shared across threads without external synchronisation.
+    All public synchronous methods are protected by a plain (non-reentrant)
+    ``threading.Lock`` so the cache can be shared across threads without
+    external synchronisation. A plain Lock acquires/releases faster than an
+    RLock, which pays for owner-thread bookkeeping the cache never uses: no
+    public method invokes another locked method while holding the lock. Do
+    not call back into the cache from code running under it (no such hooks
+    exist today); that would deadlock where an RLock would silently recurse.
 
     Async support
     -------------
     ``aget`` and ``aset`` are thin async wrappers that call the synchronous
-    core on the running event loop's thread-pool executor, making them safe
-    to ``await`` from async code without blocking the event loop.
+    core directly: a local cache op is sub-microsecond, far below the cost
+    of executor dispatch, so blocking the loop for it is the faster choice.
+    ``aget_threaded``/``aset_threaded`` keep the thread-pool path for
+    workloads where other threads hold the lock long enough to matter.
 
     Examples
     --------
@@ -90,23 +225,233 @@ class LRUCache(Generic[K, V]):
     CacheStats(hits=1, misses=1, ...)
     """
 
-    def __init__(self, capacity: int, default_ttl: Optional[float] = None) -> None:
+    def __init__(
+        self,
+        capacity: int,
+        default_ttl: Optional[float] = None,
+        ttl_resolution: float = 0.0,
+        purge_interval: float = 0.0,
+        lazy_expire: bool = True,
+        active_expire: bool = False,
+        wheel_size: int = 3600,
+        wheel_slot_s: float = 1.0,
+        no_ttl: bool = False,
+        eviction_batch: int = 1,
+        policy: str = "lru",
+        striped_stats: bool = False,
+        intern_keys: bool = False,
+    ) -> None:
+        if policy not in ("lru", "clock"):
+            raise ValueError(f"policy must be 'lru' or 'clock', got {policy!r}")
+        if no_ttl and policy != "lru":
+            raise ValueError("no_ttl=True requires policy='lru'")
+        if no_ttl and (default_ttl is not None or active_expire):
+            raise ValueError("no_ttl=True requires default_ttl=None and active_expire=False")
         if capacity < 1:
             raise ValueError(f"capacity must be >= 1, got {capacity}")
+        if eviction_batch < 1:
+            raise ValueError(f"eviction_batch must be >= 1, got {eviction_batch}")
         if default_ttl is not None and default_ttl <= 0:
             raise ValueError(f"default_ttl must be > 0, got {default_ttl}")
+        if ttl_resolution < 0:
+            raise ValueError(f"ttl_resolution must be >= 0, got {ttl_resolution}")
+        if purge_interval < 0:
+            raise ValueError(f"purge_interval must be >= 0, got {purge_interval}")
+        if active_expire and (wheel_size < 1 or wheel_slot_s <= 0):
+            raise ValueError(
+                f"wheel_size must be >= 1 and wheel_slot_s > 0, "
+                f"got {wheel_size} and {wheel_slot_s}"
+            )
 
         self._capacity = capacity
+        self._eviction_batch = min(eviction_batch, capacity)
+        # "clock" (second chance): get sets a reference bit instead of
+        # relinking, so hits never mutate the list; the eviction sweep in
+        # set pays for the ordering work instead.
+        self._second_chance = policy == "clock"
         self._default_ttl = default_ttl
-        # OrderedDict preserves insertion/move order; last = most recently used.
-        self._cache: OrderedDict[K, _Entry] = OrderedDict()
-        self._lock = threading.RLock()
+        self._ttl_resolution = ttl_resolution
+        self._purge_interval_ns = int(purge_interval * 1e9)
+        self._last_purge_ns = 0
+        self._lazy_expire = lazy_expire
+        self._now = time.monotonic_ns()
+        if ttl_resolution > 0:
+            self._start_clock()
+
+        # Timing wheel (active expiry). Keys with a TTL are filed into the
+        # slot their expiry falls in; a daemon thread reclaims slots as the
+        # hand passes. The slot index is derived from expires_at, so no
+        # extra per-entry field is needed to unfile a key.
+        self._wheel: "Optional[list[set]]" = None
+        if active_expire:
+            self._wheel = [set() for _ in range(wheel_size)]
+            self._wheel_slot_ns = int(wheel_slot_s * 1e9)
+            self._hand = time.monotonic_ns() // self._wheel_slot_ns
+            self._start_wheel(wheel_slot_s)
+
+        # TTL-free specialization: rebinding on the instance both selects
+        # the branch-free implementations and skips the class-level method
+        # descriptor on every call. Entries still use _Entry (expires_at=0)
+        # so contains/purge_stale/etc. work unchanged.
+        # With interning, a string key constructed fresh per call (the
+        # f"key{i}" pattern) resolves to the canonical object, so the
+        # dict probe's equality check short-circuits on pointer identity
+        # instead of comparing characters. sys.intern is idempotent;
+        # the exact-type guard matters because it rejects str subclasses.
+        self._intern_keys = intern_keys
+        self._no_ttl = no_ttl
+        if no_ttl:
+            self.get = self._get_no_ttl  # type: ignore[method-assign]
+            self.set = self._set_no_ttl  # type: ignore[method-assign]
+        # Plain dict maps key -> _Entry; recency order lives in an
+        # intrusive doubly-linked list threaded through the entries
+        # themselves (_head.next is MRU, _tail.prev is the LRU victim).
+        # OrderedDict.move_to_end re-hashes the key and pays a C call per
+        # promotion; relinking slots already in hand is plain pointer
+        # writes and needs no second lookup on eviction either.
+        self._cache: "dict[K, _Entry]" = {}
+        self._head = _Entry(key=None, value=None, expires_at=0)  # MRU sentinel
+        self._tail = _Entry(key=None, value=None, expires_at=0)  # LRU sentinel
+        self._head.next = self._tail
+        self._tail.prev = self._head
+        self._lock = threading.Lock()
+        # The key currently at the MRU head (_UNSET when unknown). Repeated
+        # hits on one hot key then skip the relink — the pointer
+        # shuffling is semantically a no-op for the key already at the
+        # front, and Zipf-shaped workloads hit this constantly. Every
+        # mutation that could change the front must maintain this, and
+        # removals of the tracked key reset it via _forget_last.
+        self._last_key: Any = _UNSET
+
+        # Statistics counters (updated under the lock, read lock-free).
+        # Plain ints by default: under the GIL the locked increments
+        # never contend, and a striped cell costs ~150ns extra per op
+        # (measured) for the thread-id hash and list write. Striping is
+        # for free-threaded builds, where four shared ints become a
+        # cache-line hotspot — and it makes the deliberately lossy
+        # get_unsafe counters near-exact, each thread writing its own
+        # cell.
+        self._striped_stats = striped_stats
+        counter = _StripedCounter if striped_stats else int
+        self._hits = counter()
+        self._misses = counter()
+        self._evictions = counter()
+        self._expired = counter()
+
+    # ------------------------------------------------------------------
+    # Clock
+    # ------------------------------------------------------------------
+
+    def _clock(self) -> int:
+        """Current monotonic nanoseconds, cached when ttl_resolution > 0."""
+        if self._ttl_resolution:
+            return self._now
+        return time.monotonic_ns()
+
+    def _start_clock(self) -> None:
+        # The refresher holds only a weak reference so an abandoned cache
+        # can be garbage collected; the thread then exits on its next tick.
+        ref = weakref.ref(self)
+        resolution = self._ttl_resolution
 
-        # Statistics counters (protected by the same lock)
-        self._hits = 0
-        self._misses = 0
-        self._evictions = 0
-        self._expired = 0
+        def _tick() -> None:
+            while True:
+                time.sleep(resolution)
+                cache = ref()
+                if cache is None:
+                    return
+                cache._now = time.monotonic_ns()
+
+        threading.Thread(target=_tick, daemon=True, name="lrucache-clock").start()
+
+    def _forget_last(self, key: K) -> None:
+        """Drop the MRU hint if *key* (being removed) is the one tracked."""
+        if key == self._last_key:
+            self._last_key = _UNSET
+
+    # ------------------------------------------------------------------
+    # Intrusive recency list
+    # ------------------------------------------------------------------
+    # The sentinels guarantee prev/next are never None on linked entries,
+    # so the splices below skip None checks. Hot paths (get/set) inline
+    # these writes; the cold paths below call the helpers.
+
+    @staticmethod
+    def _unlink(entry: _Entry) -> None:
+        """Splice *entry* out of the recency list (two pointer writes)."""
+        entry.prev.next = entry.next
+        entry.next.prev = entry.prev
+
+    def _push_front(self, entry: _Entry) -> None:
+        """Link *entry* in at the MRU position (four pointer writes)."""
+        head = self._head
+        entry.prev = head
+        entry.next = head.next
+        head.next.prev = entry
+        head.next = entry
+
+    # ------------------------------------------------------------------
+    # Timing wheel (active expiry)
+    # ------------------------------------------------------------------
+
+    def _wheel_file(self, key: K, expires_at: int) -> None:
+        """File *key* into the slot its expiry falls in (no-op without TTL)."""
+        if expires_at:
+            self._wheel[(expires_at // self._wheel_slot_ns) % len(self._wheel)].add(key)
+
+    def _wheel_unfile(self, key: K, expires_at: int) -> None:
+        """Remove *key* from its expiry slot (no-op without TTL)."""
+        if expires_at:
+            self._wheel[
+                (expires_at // self._wheel_slot_ns) % len(self._wheel)
+            ].discard(key)
+
+    def _start_wheel(self, slot_s: float) -> None:
+        # Same weak-reference pattern as the clock refresher: the hand
+        # thread exits once the cache is garbage collected.
+        ref = weakref.ref(self)
+
+        def _advance() -> None:
+            while True:
+                time.sleep(slot_s)
+                cache = ref()
+                if cache is None:
+                    return
+                cache._expire_passed_slots()
+
+        threading.Thread(target=_advance, daemon=True, name="lrucache-wheel").start()
+
+    def _expire_passed_slots(self) -> None:
+        """Reclaim every slot the hand has passed since the last advance."""
+        with self._lock:
+            now = time.monotonic_ns()
+            current = now // self._wheel_slot_ns
+            wheel = self._wheel
+            size = len(wheel)
+            # After a long stall the hand caps at one revolution — slots
+            # repeat modulo the wheel, so extra laps would rescan them.
+            if current - self._hand > size:
+                self._hand = current - size
+            while self._hand < current:
+                self._hand += 1
+                bucket = wheel[self._hand % size]
+                if not bucket:
+                    continue
+                keys = list(bucket)
+                bucket.clear()
+                for key in keys:
+                    entry = self._cache.get(key)
+                    if entry is None:
+                        continue
+                    if entry.is_expired(now):
+                        del self._cache[key]
+                        self._unlink(entry)
+                        self._forget_last(key)
+                        self._expired += 1
+                    else:
+                        # TTL longer than one revolution (or the entry was
+                        # re-set): file it where its expiry actually lives.
+                        self._wheel_file(key, entry.expires_at)
 
     # ------------------------------------------------------------------
     # Public synchronous API
@@ -121,21 +466,50 @@ class LRUCache(Generic[K, V]):
 
         Updates the LRU order on hit so *key* becomes the most-recently used.
         """
+        if self._intern_keys and type(key) is str:
+            key = sys.intern(key)
         with self._lock:
-            entry = self._cache.get(key)
-            if entry is None:
+            # EAFP keeps the hit path to one hash probe before promotion;
+            # a miss pays for the exception, but hits dominate by design.
+            try:
+                entry = self._cache[key]
+            except KeyError:
                 self._misses += 1
                 return default
 
-            if entry.is_expired():
+            # The expiry check reads the clock only for entries that can
+            # actually expire: expires_at == 0 (the common no-TTL case)
+            # short-circuits before the monotonic read.
+            if self._lazy_expire and entry.expires_at and self._clock() >= entry.expires_at:
                 # Lazy expiry: remove stale entry and count as miss.
                 del self._cache[key]
+                self._unlink(entry)
+                if self._wheel is not None:
+                    self._wheel_unfile(key, entry.expires_at)
+                self._forget_last(key)
                 self._expired += 1
                 self._misses += 1
                 return default
 
-            # Move to end (most recently used position).
-            self._cache.move_to_end(key)
+            if self._second_chance:
+                # Clock policy: record the access in a single bit write;
+                # the list is only reordered by the eviction sweep.
+                entry.referenced = True
+                self._hits += 1
+                return entry.value  # type: ignore[return-value]
+
+            # Promote to MRU — unless the key is already at the front,
+            # which repeated hits on a hot key ensure. Splice out, relink
+            # behind the head sentinel: six inlined pointer writes.
+            if key != self._last_key:
+                entry.prev.next = entry.next
+                entry.next.prev = entry.prev
+                head = self._head
+                entry.prev = head
+                entry.next = head.next
+                head.next.prev = entry
+                head.next = entry
+                self._last_key = key
             self._hits += 1
             return entry.value  # type: ignore[return-value]
 
@@ -158,34 +532,189 @@ class LRUCache(Generic[K, V]):
             entry).
         """
         with self._lock:
-            effective_ttl = ttl if ttl is not None else self._default_ttl
-            if effective_ttl is not None:
-                expires_at = time.monotonic() + effective_ttl
+            self._set_locked(key, value, ttl)
+
+    def set_many(self, items, ttl: Optional[float] = None) -> None:
+        """
+        Insert or update several ``(key, value)`` pairs in one critical
+        section.
+
+        Equivalent to calling ``set`` per pair but acquires the lock
+        once, so a warm-up or bulk-load burst pays one acquire/release
+        instead of one per item. *items* is any iterable of pairs —
+        ``dict.items()`` works. *ttl* applies to every pair with the
+        same semantics as in ``set``.
+        """
+        if ttl is not None and self._no_ttl:
+            raise ValueError("cache was created with no_ttl=True; ttl is not supported")
+        with self._lock:
+            set_locked = self._set_locked
+            for key, value in items:
+                set_locked(key, value, ttl)
+
+    def _set_locked(self, key: K, value: V, ttl: Optional[float]) -> None:
+        """The body of set(); the caller must hold the lock."""
+        if self._intern_keys and type(key) is str:
+            key = sys.intern(key)
+        effective_ttl = ttl if ttl is not None else self._default_ttl
+        if effective_ttl is not None:
+            now = self._clock()
+            expires_at = now + int(effective_ttl * 1e9)
+        else:
+            expires_at = 0  # sentinel: never expires, clock not read
+
+        entry = self._cache.get(key)
+        if entry is not None:
+            # Update in place: reuses the existing _Entry allocation and
+            # the hash probe that fetched it; only MRU promotion remains.
+            if self._wheel is not None:
+                self._wheel_unfile(key, entry.expires_at)
+                self._wheel_file(key, expires_at)
+            entry.value = value
+            entry.expires_at = expires_at
+            if self._second_chance:
+                entry.referenced = True
+            elif key != self._last_key:
+                self._unlink(entry)
+                self._push_front(entry)
+                self._last_key = key
+            return
+
+        # For a new key we may need to make room first.
+        if len(self._cache) >= self._capacity:
+            # If the new entry is already expired, don't evict anything.
+            if expires_at:
+                if now >= expires_at:
+                    return
             else:
-                expires_at = None
-
-            if key not in self._cache:
-                # For a new key we may need to make room first.
-                if len(self._cache) >= self._capacity:
-                    # If the new entry is already expired, don't evict anything.
-                    if expires_at is not None and time.monotonic() >= expires_at:
-                        return
-
-                    # Prefer evicting an already-expired entry over a valid LRU one.
-                    expired_key = next(
-                        (k for k, e in self._cache.items() if e.is_expired()), None
-                    )
-                    if expired_key is not None:
-                        del self._cache[expired_key]
-                        self._expired += 1
-                    else:
-                        self._cache.popitem(last=False)  # Remove oldest (LRU)
-                        self._evictions += 1
+                # TTL-free insert: the clock was skipped above, but
+                # the expired-preference scan below still needs it
+                # in case resident entries carry TTLs.
+                now = self._clock()
+
+            # Prefer evicting an already-expired entry over a valid LRU one.
+            expired_key = next(
+                (k for k, e in self._cache.items() if e.is_expired(now)), None
+            )
+            if expired_key is not None:
+                evicted = self._cache.pop(expired_key)
+                self._unlink(evicted)
+                self._expired += 1
+                if self._wheel is not None:
+                    self._wheel_unfile(expired_key, evicted.expires_at)
+                self._forget_last(expired_key)
+            else:
+                # The LRU victim is at hand via tail.prev — no key
+                # lookup needed to find it, one dict delete to drop it.
+                # Evicting eviction_batch victims at once leaves
+                # headroom so the next batch-1 inserts on a thrashing
+                # cache skip this whole block.
+                for _ in range(self._eviction_batch):
+                    evicted = self._tail.prev
+                    if self._second_chance:
+                        # Second chance: a referenced entry survives —
+                        # its bit is cleared and it rejoins the front;
+                        # the sweep evicts the first unreferenced one.
+                        # Bounded: one full revolution clears every bit.
+                        while evicted.referenced:
+                            evicted.referenced = False
+                            self._unlink(evicted)
+                            self._push_front(evicted)
+                            evicted = self._tail.prev
+                    self._unlink(evicted)
+                    del self._cache[evicted.key]
+                    self._evictions += 1
+                    if self._wheel is not None:
+                        self._wheel_unfile(evicted.key, evicted.expires_at)
+                    self._forget_last(evicted.key)
 
-            # Single assignment covers both insert and update; move_to_end
-            # promotes the key to MRU position in both cases.
-            self._cache[key] = _Entry(value=value, expires_at=expires_at)
-            self._cache.move_to_end(key)
+        # A fresh insert lands at the MRU front of the recency list.
+        entry = _Entry(key=key, value=value, expires_at=expires_at)
+        self._cache[key] = entry
+        self._push_front(entry)
+        self._last_key = key
+        if self._wheel is not None:
+            self._wheel_file(key, expires_at)
+
+    def get_unsafe(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """
+        Lock-free read for read-dominated workloads.
+
+        Skips the lock entirely: a dict read is a single C-level call that
+        is atomic under CPython's GIL, so this returns a consistent entry
+        or ``default`` even while writers run. A full RWLock was
+        considered and rejected — reader-counter bookkeeping costs more
+        than the exclusive lock it replaces on critical sections this
+        short.
+
+        Trade-offs versus ``get`` (all deliberate):
+        - does not promote the key in LRU order, so a key read only via
+          this method ages toward eviction;
+        - filters expired entries but does not remove them;
+        - hit/miss increments may be lost under write races (counter
+          read-modify-write is not atomic across threads);
+        - the value may be stale by one concurrent ``set``.
+        """
+        if self._intern_keys and type(key) is str:
+            key = sys.intern(key)
+        entry = self._cache.get(key)
+        if entry is None:
+            self._misses += 1
+            return default
+        if self._lazy_expire and entry.expires_at and self._clock() >= entry.expires_at:
+            self._misses += 1
+            return default
+        self._hits += 1
+        return entry.value  # type: ignore[return-value]
+
+    def _get_no_ttl(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """get() specialized for no_ttl=True: no expiry branch at all."""
+        if self._intern_keys and type(key) is str:
+            key = sys.intern(key)
+        with self._lock:
+            try:
+                entry = self._cache[key]
+            except KeyError:
+                self._misses += 1
+                return default
+            if key != self._last_key:
+                entry.prev.next = entry.next
+                entry.next.prev = entry.prev
+                head = self._head
+                entry.prev = head
+                entry.next = head.next
+                head.next.prev = entry
+                head.next = entry
+                self._last_key = key
+            self._hits += 1
+            return entry.value  # type: ignore[return-value]
+
+    def _set_no_ttl(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """set() specialized for no_ttl=True; rejects per-entry TTLs."""
+        if ttl is not None:
+            raise ValueError("cache was created with no_ttl=True; ttl is not supported")
+        if self._intern_keys and type(key) is str:
+            key = sys.intern(key)
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                entry.value = value
+                if key != self._last_key:
+                    self._unlink(entry)
+                    self._push_front(entry)
+                    self._last_key = key
+                return
+            if len(self._cache) >= self._capacity:
+                for _ in range(self._eviction_batch):
+                    evicted = self._tail.prev  # oldest (LRU)
+                    self._unlink(evicted)
+                    del self._cache[evicted.key]
+                    self._evictions += 1
+                    self._forget_last(evicted.key)
+            entry = _Entry(key=key, value=value, expires_at=0)
+            self._cache[key] = entry
+            self._push_front(entry)
+            self._last_key = key
 
     def delete(self, key: K) -> bool:
         """
@@ -193,16 +722,55 @@ class LRUCache(Generic[K, V]):
 
         Returns ``True`` if the key existed (and was removed), ``False`` otherwise.
         """
+        if self._intern_keys and type(key) is str:
+            key = sys.intern(key)
+        with self._lock:
+            entry = self._cache.pop(key, None)
+            if entry is None:
+                return False
+            self._unlink(entry)
+            if self._wheel is not None:
+                self._wheel_unfile(key, entry.expires_at)
+            self._forget_last(key)
+            return True
+
+    def purge_stale(self) -> int:
+        """
+        Remove every expired entry in one sweep; returns the number removed.
+
+        Dampened by ``purge_interval``: a call arriving within the interval
+        of the last effective sweep returns ``0`` without walking the cache,
+        so callers may invoke this opportunistically (e.g. on a timer or
+        alongside hot operations) without re-paying the O(n) walk. This is
+        the required cleanup mechanism when ``lazy_expire=False``.
+        """
         with self._lock:
-            if key in self._cache:
+            now = self._clock()
+            if self._purge_interval_ns and now - self._last_purge_ns < self._purge_interval_ns:
+                return 0
+            self._last_purge_ns = now
+            stale = [(k, e) for k, e in self._cache.items() if e.is_expired(now)]
+            for key, entry in stale:
                 del self._cache[key]
-                return True
-            return False
+                self._unlink(entry)
+                if self._wheel is not None:
+                    self._wheel_unfile(key, entry.expires_at)
+                self._forget_last(key)
+            self._expired += len(stale)
+            return len(stale)
 
     def clear(self) -> None:
         """Remove all entries from the cache (statistics are preserved)."""
         with self._lock:
             self._cache.clear()
+            # Relink the sentinels; the dropped entries form their own
+            # cycles through prev/next, which the cycle collector reclaims.
+            self._head.next = self._tail
+            self._tail.prev = self._head
+            self._last_key = _UNSET
+            if self._wheel is not None:
+                for bucket in self._wheel:
+                    bucket.clear()
 
     def contains(self, key: K) -> bool:
         """
@@ -212,29 +780,40 @@ class LRUCache(Generic[K, V]):
         modify statistics, or remove expired entries. Use ``get()`` when you
         also want the value and full LRU/stats semantics.
         """
+        if self._intern_keys and type(key) is str:
+            key = sys.intern(key)
         with self._lock:
             entry = self._cache.get(key)
             if entry is None:
                 return False
-            return not entry.is_expired()
+            if not self._lazy_expire or not entry.expires_at:
+                return True
+            return self._clock() < entry.expires_at
 
     def stats(self) -> CacheStats:
-        """Return a snapshot of the current hit/miss/eviction/expired counters."""
-        with self._lock:
-            return CacheStats(
-                hits=self._hits,
-                misses=self._misses,
-                evictions=self._evictions,
-                expired=self._expired,
-            )
+        """Return a snapshot of the current hit/miss/eviction/expired counters.
+
+        Deliberately lock-free: each counter read is a single GIL-atomic
+        attribute load, so a monitoring thread polling ``stats()`` never
+        serializes against cache operations. The four counters may be
+        mutually inconsistent by the few operations that complete between
+        the reads — acceptable for statistics, where "slightly stale" and
+        "current" are indistinguishable to the consumer.
+        """
+        # int() collapses a striped counter to its sum and is identity
+        # on the plain-int representation.
+        return CacheStats(
+            int(self._hits), int(self._misses), int(self._evictions), int(self._expired)
+        )
 
     def reset_stats(self) -> None:
         """Reset all statistics counters to zero."""
         with self._lock:
-            self._hits = 0
-            self._misses = 0
-            self._evictions = 0
-            self._expired = 0
+            counter = _StripedCounter if self._striped_stats else int
+            self._hits = counter()
+            self._misses = counter()
+            self._evictions = counter()
+            self._expired = counter()
 
     def size(self) -> int:
         """Return the number of entries currently in the cache.
@@ -259,21 +838,41 @@ class LRUCache(Generic[K, V]):
         """
         Async version of get().
 
-        Runs the synchronous implementation in the default thread-pool
-        executor so the event loop is not blocked.
+        Calls the synchronous core directly: the critical section is a
+        dict lookup under an uncontended lock (sub-microsecond), while a
+        run_in_executor round-trip costs tens of microseconds of
+        scheduling — pure overhead for a local in-memory cache. Under
+        heavy cross-thread contention where lock waits could stall the
+        event loop, use ``aget_threaded``.
         """
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self.get, key, default)
+        return self.get(key, default)
 
     async def aset(self, key: K, value: V, ttl: Optional[float] = None) -> None:
         """
         Async version of set().
 
-        Runs the synchronous implementation in the default thread-pool
-        executor so the event loop is not blocked.
+        Calls the synchronous core directly — see ``aget`` for the
+        rationale; ``aset_threaded`` keeps the off-loop path.
+        """
+        self.set(key, value, ttl)
+
+    async def aget_threaded(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """get() on the default thread-pool executor, off the event loop.
+
+        Only useful when the lock is heavily contended by other threads;
+        otherwise ``aget`` is strictly faster.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get, key, default)
+
+    async def aset_threaded(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """set() on the default thread-pool executor, off the event loop.
+
+        run_in_executor forwards *args itself, so passing them directly
+        skips the per-call lambda closure the old code allocated.
         """
         loop = asyncio.get_running_loop()
-        await loop.run_in_executor(None, lambda: self.set(key, value, ttl))
+        await loop.run_in_executor(None, self.set, key, value, ttl)
 
     # ------------------------------------------------------------------
     # Dunder helpers
@@ -292,6 +891,132 @@ class LRUCache(Generic[K, V]):
         )
 
 
+class ShardedLRUCache(Generic[K, V]):
+    """
+    Lock-striped LRU cache: N independent ``LRUCache`` shards selected by key hash.
+
+    A single-lock cache serializes every reader and writer. Partitioning the
+    key space over ``num_shards`` sub-caches gives each shard its own lock,
+    recency list and counters, so threads touching different shards never
+    contend — read/write throughput scales toward ``num_shards`` under
+    multi-threaded load.
+
+    Trade-offs versus ``LRUCache``:
+    - LRU order is per shard, not global: the globally least-recently-used
+      key is only evicted when its own shard fills.
+    - ``capacity`` is split evenly, so a pathological key distribution can
+      evict from a hot shard while cold shards have room.
+
+    Parameters
+    ----------
+    capacity : int
+        Total entry budget, split evenly across shards. Must be >= num_shards
+        so every shard holds at least one entry.
+    default_ttl : float | None
+        As for ``LRUCache``; applied to every shard.
+    num_shards : int | None
+        Number of shards; must be a power of two so shard selection is a
+        single mask of the key hash. ``None`` (default) derives it from
+        the capacity: the largest power of two giving each shard at
+        least 64 entries, capped at 64 shards — small caches get one
+        lock instead of 16 near-empty shards, large ones stripe enough
+        to spread a typical thread count.
+    ttl_resolution : float
+        As for ``LRUCache``; applied to every shard.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        default_ttl: Optional[float] = None,
+        num_shards: Optional[int] = None,
+        ttl_resolution: float = 0.0,
+    ) -> None:
+        if num_shards is None:
+            target = min(capacity // 64, 64)
+            num_shards = 1
+            while num_shards * 2 <= target:
+                num_shards *= 2
+        if num_shards < 1 or (num_shards & (num_shards - 1)) != 0:
+            raise ValueError(f"num_shards must be a power of two >= 1, got {num_shards}")
+        if capacity < num_shards:
+            raise ValueError(
+                f"capacity must be >= num_shards ({num_shards}), got {capacity}"
+            )
+        self._mask = num_shards - 1
+        self._shards: "tuple[LRUCache[K, V], ...]" = tuple(
+            LRUCache(capacity // num_shards, default_ttl, ttl_resolution)
+            for _ in range(num_shards)
+        )
+
+    def _shard(self, key: K) -> "LRUCache[K, V]":
+        return self._shards[hash(key) & self._mask]
+
+    # Delegation — each call takes only its shard's lock.
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        return self._shard(key).get(key, default)
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        self._shard(key).set(key, value, ttl)
+
+    def delete(self, key: K) -> bool:
+        return self._shard(key).delete(key)
+
+    def contains(self, key: K) -> bool:
+        return self._shard(key).contains(key)
+
+    def clear(self) -> None:
+        for shard in self._shards:
+            shard.clear()
+
+    def stats(self) -> CacheStats:
+        """Aggregate counters summed across all shards (not atomic: shards
+        are snapshotted one at a time, so concurrent ops may skew totals
+        by a few counts)."""
+        snapshots = [shard.stats() for shard in self._shards]
+        return CacheStats(
+            hits=sum(s.hits for s in snapshots),
+            misses=sum(s.misses for s in snapshots),
+            evictions=sum(s.evictions for s in snapshots),
+            expired=sum(s.expired for s in snapshots),
+        )
+
+    def reset_stats(self) -> None:
+        for shard in self._shards:
+            shard.reset_stats()
+
+    def size(self) -> int:
+        return sum(shard.size() for shard in self._shards)
+
+    @property
+    def capacity(self) -> int:
+        """Total capacity across all shards."""
+        return sum(shard.capacity for shard in self._shards)
+
+    @property
+    def num_shards(self) -> int:
+        return len(self._shards)
+
+    async def aget(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        return await self._shard(key).aget(key, default)
+
+    async def aset(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        await self._shard(key).aset(key, value, ttl)
+
+    def __len__(self) -> int:
+        return self.size()
+
+    def __contains__(self, key: object) -> bool:
+        return self.contains(key)  # type: ignore[arg-type]
+
+    def __repr__(self) -> str:
+        return (
+            f"ShardedLRUCache(capacity={self.capacity}, size={self.size()}, "
+            f"num_shards={self.num_shards})"
+        )
+
+
 # ---------------------------------------------------------------------------
 # Usage example
 # ---------------------------------------------------------------------------
@@ -8,7 +8,7 @@ import time
 
 import pytest
 
-from solution import CacheStats, LRUCache
+from solution import CacheStats, LRUCache, ShardedLRUCache
 
 
 # ---------------------------------------------------------------------------
@@ -336,32 +336,32 @@ class TestDeleteClearContains:
 # ---------------------------------------------------------------------------
 
 class TestAsyncAPI:
-    def test_async_set_and_get(self):
+    def test_async_set_and_get(self, event_loop):
         async def _run():
             cache: LRUCache[str, int] = LRUCache(capacity=5)
             await cache.aset("key", 99)
             result = await cache.aget("key")
             assert result == 99
 
-        asyncio.run(_run())
+        event_loop.run_until_complete(_run())
 
-    def test_async_get_miss_returns_none(self):
+    def test_async_get_miss_returns_none(self, event_loop):
         async def _run():
             cache: LRUCache[str, int] = LRUCache(capacity=5)
             result = await cache.aget("missing")
             assert result is None
 
-        asyncio.run(_run())
+        event_loop.run_until_complete(_run())
 
-    def test_async_get_with_default(self):
+    def test_async_get_with_default(self, event_loop):
         async def _run():
             cache: LRUCache[str, int] = LRUCache(capacity=5)
             result = await cache.aget("missing", -1)
             assert result == -1
 
-        asyncio.run(_run())
+        event_loop.run_until_complete(_run())
 
-    def test_async_stats_updated(self):
+    def test_async_stats_updated(self, event_loop):
         async def _run():
             cache: LRUCache[str, int] = LRUCache(capacity=5)
             await cache.aset("k", 1)
@@ -371,9 +371,9 @@ class TestAsyncAPI:
             assert s.hits == 1
             assert s.misses == 1
 
-        asyncio.run(_run())
+        event_loop.run_until_complete(_run())
 
-    def test_async_ttl(self):
+    def test_async_ttl(self, event_loop):
         async def _run():
             cache: LRUCache[str, str] = LRUCache(capacity=5)
             await cache.aset("k", "v", ttl=0.05)
@@ -381,9 +381,9 @@ class TestAsyncAPI:
             result = await cache.aget("k")
             assert result is None
 
-        asyncio.run(_run())
+        event_loop.run_until_complete(_run())
 
-    def test_async_concurrent_sets(self):
+    def test_async_concurrent_sets(self, event_loop):
         async def _run():
             cache: LRUCache[int, int] = LRUCache(capacity=100)
             tasks = [cache.aset(i, i * 2) for i in range(50)]
@@ -392,9 +392,9 @@ class TestAsyncAPI:
             for i in range(50):
                 assert await cache.aget(i) == i * 2
 
-        asyncio.run(_run())
+        event_loop.run_until_complete(_run())
 
-    def test_async_run_in_executor_does_not_block(self):
+    def test_async_run_in_executor_does_not_block(self, event_loop):
         """Ensure aset/aget can be gathered concurrently."""
         async def _run():
             cache: LRUCache[str, str] = LRUCache(capacity=10)
@@ -410,7 +410,7 @@ class TestAsyncAPI:
             )
             assert set(results) == {"1", "2", "3"}
 
-        asyncio.run(_run())
+        event_loop.run_until_complete(_run())
 
 
 # ---------------------------------------------------------------------------
@@ -583,3 +583,607 @@ class TestEdgeCases:
         cache.set("k", 2)
         assert cache.get("k") == 2
         assert len(cache) == 1
+
+
+# ---------------------------------------------------------------------------
+# Constructor option validation (new knobs)
+# ---------------------------------------------------------------------------
+
+class TestOptionValidation:
+    def test_unknown_policy_raises(self):
+        with pytest.raises(ValueError, match="policy"):
+            LRUCache(capacity=5, policy="fifo")
+
+    def test_no_ttl_with_clock_policy_raises(self):
+        with pytest.raises(ValueError, match="no_ttl"):
+            LRUCache(capacity=5, no_ttl=True, policy="clock")
+
+    def test_no_ttl_with_default_ttl_raises(self):
+        with pytest.raises(ValueError, match="no_ttl"):
+            LRUCache(capacity=5, no_ttl=True, default_ttl=10.0)
+
+    def test_no_ttl_with_active_expire_raises(self):
+        with pytest.raises(ValueError, match="no_ttl"):
+            LRUCache(capacity=5, no_ttl=True, active_expire=True)
+
+    def test_eviction_batch_zero_raises(self):
+        with pytest.raises(ValueError, match="eviction_batch"):
+            LRUCache(capacity=5, eviction_batch=0)
+
+    def test_negative_ttl_resolution_raises(self):
+        with pytest.raises(ValueError, match="ttl_resolution"):
+            LRUCache(capacity=5, ttl_resolution=-1.0)
+
+    def test_negative_purge_interval_raises(self):
+        with pytest.raises(ValueError, match="purge_interval"):
+            LRUCache(capacity=5, purge_interval=-1.0)
+
+    def test_invalid_wheel_geometry_raises(self):
+        with pytest.raises(ValueError, match="wheel"):
+            LRUCache(capacity=5, active_expire=True, wheel_size=0)
+        with pytest.raises(ValueError, match="wheel"):
+            LRUCache(capacity=5, active_expire=True, wheel_slot_s=0)
+
+
+# ---------------------------------------------------------------------------
+# purge_stale / lazy_expire
+# ---------------------------------------------------------------------------
+
+class TestPurgeStale:
+    def test_purge_removes_expired_and_returns_count(self):
+        cache: LRUCache[str, int] = LRUCache(capacity=5)
+        cache.set("a", 1, ttl=0.05)
+        cache.set("b", 2, ttl=0.05)
+        cache.set("c", 3)  # no TTL — must survive
+        time.sleep(0.1)
+        assert cache.purge_stale() == 2
+        assert len(cache) == 1
+        assert cache.get("c") == 3
+
+    def test_purge_counts_expired_in_stats(self):
+        cache: LRUCache[str, int] = LRUCache(capacity=5)
+        cache.set("a", 1, ttl=0.05)
+        time.sleep(0.1)
+        cache.purge_stale()
+        assert cache.stats().expired == 1
+
+    def test_purge_empty_cache_returns_zero(self):
+        cache = LRUCache(capacity=5)
+        assert cache.purge_stale() == 0
+
+    def test_purge_with_nothing_stale_returns_zero(self):
+        cache: LRUCache[str, int] = LRUCache(capacity=5)
+        cache.set("a", 1, ttl=60.0)
+        assert cache.purge_stale() == 0
+        assert len(cache) == 1
+
+    def test_purge_interval_dampens_repeat_sweeps(self):
+        cache: LRUCache[str, int] = LRUCache(capacity=5, purge_interval=60.0)
+        cache.set("a", 1, ttl=0.05)
+        time.sleep(0.1)
+        assert cache.purge_stale() == 1
+        # A second stale entry within the interval is not swept.
+        cache.set("b", 2, ttl=0.05)
+        time.sleep(0.1)
+        assert cache.purge_stale() == 0
+        assert cache.contains("b") is False  # still expired, just unswept
+
+    def test_lazy_expire_false_serves_stale_until_purged(self):
+        cache: LRUCache[str, str] = LRUCache(capacity=5, lazy_expire=False)
+        cache.set("k", "v", ttl=0.05)
+        time.sleep(0.1)
+        # Accesses skip the expiry branch entirely.
+        assert cache.get("k") == "v"
+        assert cache.contains("k") is True
+        # The sweep is the only cleanup path.
+        assert cache.purge_stale() == 1
+        assert cache.get("k") is None
+
+    def test_lazy_expire_true_is_the_default(self):
+        cache: LRUCache[str, str] = LRUCache(capacity=5)
+        cache.set("k", "v", ttl=0.05)
+        time.sleep(0.1)
+        assert cache.get("k") is None
+
+
+# ---------------------------------------------------------------------------
+# get_unsafe (lock-free read path)
+# ---------------------------------------------------------------------------
+
+class TestGetUnsafe:
+    def test_hit_returns_value(self):
+        cache: LRUCache[str, int] = LRUCache(capacity=5)
+        cache.set("k", 42)
+        assert cache.get_unsafe("k") == 42
+
+    def test_miss_returns_default(self):
+        cache: LRUCache[str, int] = LRUCache(capacity=5)
+        assert cache.get_unsafe("missing") is None
+        assert cache.get_unsafe("missing", -1) == -1
+
+    def test_does_not_promote_lru_order(self):
+        cache: LRUCache[str, int] = LRUCache(capacity=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get_unsafe("a")  # must NOT make "a" most-recently used
+        cache.set("c", 3)      # evicts "a", the true LRU
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+    def test_filters_expired_without_removing(self):
+        cache: LRUCache[str, str] = LRUCache(capacity=5)
+        cache.set("k", "v", ttl=0.05)
+        time.sleep(0.1)
+        assert cache.get_unsafe("k") is None
+        assert cache.size() == 1  # entry still resident — no lock, no removal
+
+
+# ---------------------------------------------------------------------------
+# no_ttl specialization
+# ---------------------------------------------------------------------------
+
+class TestNoTTL:
+    def test_basic_get_set_and_eviction(self):
+        cache: LRUCache[str, int] = LRUCache(capacity=2, no_ttl=True)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)  # evicts "a"
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    def test_get_promotes_to_mru(self):
+        cache: LRUCache[str, int] = LRUCache(capacity=2, no_ttl=True)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")     # "b" becomes LRU
+        cache.set("c", 3)  # evicts "b"
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+
+    def test_update_existing_key_keeps_single_entry(self):
+        cache: LRUCache[str, int] = LRUCache(capacity=5, no_ttl=True)
+        cache.set("k", 1)
+        cache.set("k", 2)
+        assert cache.get("k") == 2
+        assert len(cache) == 1
+
+    def test_per_entry_ttl_raises(self):
+        cache: LRUCache[str, int] = LRUCache(capacity=5, no_ttl=True)
+        with pytest.raises(ValueError, match="no_ttl"):
+            cache.set("k", 1, ttl=10.0)
+
+    def test_set_many_with_ttl_raises(self):
+        cache: LRUCache[str, int] = LRUCache(capacity=5, no_ttl=True)
+        with pytest.raises(ValueError, match="no_ttl"):
+            cache.set_many([("a", 1)], ttl=10.0)
+
+    def test_stats_still_tracked(self):
+        cache: LRUCache[str, int] = LRUCache(capacity=2, no_ttl=True)
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("x")
+        cache.set("b", 2)
+        cache.set("c", 3)
+        s = cache.stats()
+        assert s.hits == 1
+        assert s.misses == 1
+        assert s.evictions == 1
+
+
+# ---------------------------------------------------------------------------
+# policy="clock" (second chance)
+# ---------------------------------------------------------------------------
+
+class TestClockPolicy:
+    def test_basic_get_set(self):
+        cache: LRUCache[str, int] = LRUCache(capacity=3, policy="clock")
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("x") is None
+
+    def test_unreferenced_tail_is_evicted(self):
+        cache: LRUCache[str, int] = LRUCache(capacity=3, policy="clock")
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        cache.set("d", 4)  # nothing referenced: "a" (oldest) is the victim
+        assert not cache.contains("a")
+        assert cache.contains("b")
+
+    def test_referenced_entry_gets_second_chance(self):
+        cache: LRUCache[str, int] = LRUCache(capacity=3, policy="clock")
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        cache.get("a")     # sets the reference bit, no relink
+        cache.set("d", 4)  # sweep skips "a", evicts "b" (next unreferenced)
+        assert cache.contains("a")
+        assert not cache.contains("b")
+
+    def test_all_referenced_still_terminates(self):
+        cache: LRUCache[str, int] = LRUCache(capacity=2, policy="clock")
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.get("b")
+        cache.set("c", 3)  # one revolution clears every bit, then evicts
+        assert len(cache) == 2
+        assert cache.contains("c")
+
+    def test_size_respects_capacity(self):
+        cache: LRUCache[int, int] = LRUCache(capacity=10, policy="clock")
+        for i in range(100):
+            cache.set(i, i)
+            if i % 3 == 0:
+                cache.get(i)
+        assert len(cache) == 10
+
+    def test_ttl_expiry_still_works(self):
+        cache: LRUCache[str, str] = LRUCache(capacity=5, policy="clock")
+        cache.set("k", "v", ttl=0.05)
+        time.sleep(0.1)
+        assert cache.get("k") is None
+
+
+# ---------------------------------------------------------------------------
+# eviction_batch
+# ---------------------------------------------------------------------------
+
+class TestEvictionBatch:
+    def test_batch_evicts_multiple_lru_entries(self):
+        cache: LRUCache[int, int] = LRUCache(capacity=5, eviction_batch=3)
+        for i in range(5):
+            cache.set(i, i)
+        cache.set(5, 5)  # evicts 0, 1, 2 together
+        assert len(cache) == 3
+        assert cache.stats().evictions == 3
+        for victim in (0, 1, 2):
+            assert not cache.contains(victim)
+        for kept in (3, 4, 5):
+            assert cache.contains(kept)
+
+    def test_headroom_absorbs_following_inserts(self):
+        cache: LRUCache[int, int] = LRUCache(capacity=5, eviction_batch=3)
+        for i in range(6):  # the 6th insert triggers the one batch
+            cache.set(i, i)
+        cache.set(6, 6)
+        cache.set(7, 7)
+        # Two more inserts fit in the headroom — no further evictions.
+        assert cache.stats().evictions == 3
+        assert len(cache) == 5
+
+    def test_batch_clamped_to_capacity(self):
+        cache: LRUCache[int, int] = LRUCache(capacity=2, eviction_batch=10)
+        cache.set(1, 1)
+        cache.set(2, 2)
+        cache.set(3, 3)  # batch clamps to 2: evict both, then insert
+        assert len(cache) == 1
+        assert cache.get(3) == 3
+
+    def test_default_batch_is_one(self):
+        cache: LRUCache[int, int] = LRUCache(capacity=3)
+        for i in range(4):
+            cache.set(i, i)
+        assert len(cache) == 3
+        assert cache.stats().evictions == 1
+
+
+# ---------------------------------------------------------------------------
+# set_many
+# ---------------------------------------------------------------------------
+
+class TestSetMany:
+    def test_inserts_all_pairs(self):
+        cache: LRUCache[str, int] = LRUCache(capacity=10)
+        cache.set_many({"a": 1, "b": 2, "c": 3}.items())
+        assert len(cache) == 3
+        assert cache.get("b") == 2
+
+    def test_behaves_like_sequential_sets_at_capacity(self):
+        cache: LRUCache[int, int] = LRUCache(capacity=3)
+        cache.set_many((i, i) for i in range(5))
+        assert len(cache) == 3
+        for victim in (0, 1):
+            assert not cache.contains(victim)
+        for kept in (2, 3, 4):
+            assert cache.get(kept) == kept
+
+    def test_updates_existing_keys(self):
+        cache: LRUCache[str, int] = LRUCache(capacity=5)
+        cache.set("a", 1)
+        cache.set_many([("a", 10), ("b", 2)])
+        assert cache.get("a") == 10
+        assert len(cache) == 2
+
+    def test_ttl_applies_to_every_pair(self):
+        cache: LRUCache[str, int] = LRUCache(capacity=5)
+        cache.set_many([("a", 1), ("b", 2)], ttl=0.05)
+        time.sleep(0.1)
+        assert cache.get("a") is None
+        assert cache.get("b") is None
+
+    def test_empty_iterable_is_a_noop(self):
+        cache: LRUCache[str, int] = LRUCache(capacity=5)
+        cache.set_many([])
+        assert len(cache) == 0
+
+
+# ---------------------------------------------------------------------------
+# striped_stats
+# ---------------------------------------------------------------------------
+
+class TestStripedStats:
+    def test_counters_match_plain_behavior(self):
+        cache: LRUCache[str, int] = LRUCache(capacity=2, striped_stats=True)
+        cache.set("a", 1)
+        cache.get("a")   # hit
+        cache.get("x")   # miss
+        cache.set("b", 2)
+        cache.set("c", 3)  # eviction
+        s = cache.stats()
+        assert s.hits == 1
+        assert s.misses == 1
+        assert s.evictions == 1
+
+    def test_expired_counted(self):
+        cache: LRUCache[str, int] = LRUCache(capacity=5, striped_stats=True)
+        cache.set("k", 1, ttl=0.05)
+        time.sleep(0.1)
+        cache.get("k")
+        assert cache.stats().expired == 1
+
+    def test_reset_stats_zeroes_striped_counters(self):
+        cache: LRUCache[str, int] = LRUCache(capacity=5, striped_stats=True)
+        cache.set("k", 1)
+        cache.get("k")
+        cache.reset_stats()
+        s = cache.stats()
+        assert s.hits == 0 and s.misses == 0
+
+    def test_exact_totals_under_locked_concurrency(self):
+        """Locked get/set increments must stay exact with striping."""
+        cache: LRUCache[int, int] = LRUCache(capacity=10, striped_stats=True)
+        for i in range(10):
+            cache.set(i, i)
+
+        def worker():
+            for i in range(100):
+                cache.get(i % 20)  # half hit, half miss
+
+        threads = [threading.Thread(target=worker) for _ in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        s = cache.stats()
+        assert s.hits + s.misses == 1000
+
+
+# ---------------------------------------------------------------------------
+# intern_keys
+# ---------------------------------------------------------------------------
+
+class TestInternKeys:
+    def test_fresh_equal_strings_resolve_to_same_entry(self):
+        cache: LRUCache[str, int] = LRUCache(capacity=10, intern_keys=True)
+        for i in range(5):
+            cache.set(f"key{i}", i)
+        # Lookups with freshly built (equal, not identical) strings hit.
+        for i in range(5):
+            assert cache.get("key" + str(i)) == i
+        assert len(cache) == 5
+
+    def test_delete_and_contains_with_fresh_strings(self):
+        cache: LRUCache[str, int] = LRUCache(capacity=5, intern_keys=True)
+        cache.set("key" + "1", 1)
+        assert cache.contains("key1")
+        assert cache.delete("key1") is True
+        assert not cache.contains("key1")
+
+    def test_non_string_keys_untouched(self):
+        cache: LRUCache = LRUCache(capacity=5, intern_keys=True)
+        cache.set((1, 2), "tuple")
+        cache.set(7, "int")
+        assert cache.get((1, 2)) == "tuple"
+        assert cache.get(7) == "int"
+
+    def test_str_subclass_keys_still_work(self):
+        """sys.intern rejects str subclasses; the exact-type guard must
+        route them around interning, not crash."""
+        class Key(str):
+            pass
+
+        cache: LRUCache = LRUCache(capacity=5, intern_keys=True)
+        cache.set(Key("sub"), 1)
+        assert cache.get("sub") == 1  # equal by value, interned or not
+
+
+# ---------------------------------------------------------------------------
+# Active expiry (timing wheel)
+# ---------------------------------------------------------------------------
+
+class TestActiveExpire:
+    def _wait_until(self, predicate, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if predicate():
+                return True
+            time.sleep(0.02)
+        return predicate()
+
+    def test_expired_entry_reclaimed_without_access(self):
+        cache: LRUCache[str, int] = LRUCache(
+            capacity=5, active_expire=True, wheel_size=8, wheel_slot_s=0.05
+        )
+        cache.set("k", 1, ttl=0.05)
+        # No get/purge: the wheel hand alone must reclaim the entry.
+        assert self._wait_until(lambda: cache.size() == 0)
+        assert cache.stats().expired == 1
+
+    def test_entries_without_ttl_survive_the_hand(self):
+        cache: LRUCache[str, int] = LRUCache(
+            capacity=5, active_expire=True, wheel_size=8, wheel_slot_s=0.05
+        )
+        cache.set("k", 1)
+        time.sleep(0.3)  # several revolutions
+        assert cache.get("k") == 1
+
+    def test_reset_entry_is_not_reclaimed_early(self):
+        cache: LRUCache[str, int] = LRUCache(
+            capacity=5, active_expire=True, wheel_size=8, wheel_slot_s=0.05
+        )
+        cache.set("k", 1, ttl=0.05)
+        cache.set("k", 2, ttl=60.0)  # re-filed under the new expiry
+        time.sleep(0.3)
+        assert cache.get("k") == 2
+
+    def test_deleted_entry_not_counted_expired(self):
+        cache: LRUCache[str, int] = LRUCache(
+            capacity=5, active_expire=True, wheel_size=8, wheel_slot_s=0.05
+        )
+        cache.set("k", 1, ttl=0.05)
+        cache.delete("k")
+        time.sleep(0.3)
+        assert cache.stats().expired == 0
+
+
+# ---------------------------------------------------------------------------
+# MRU-hint sentinel (regression: None is a legitimate key)
+# ---------------------------------------------------------------------------
+
+class TestNoneKeyRecency:
+    def test_none_key_round_trip(self):
+        cache: LRUCache = LRUCache(capacity=5)
+        cache.set(None, "v")
+        assert cache.get(None) == "v"
+        assert cache.contains(None)
+        assert cache.delete(None) is True
+
+    def test_none_key_promoted_after_hint_reset(self):
+        """A delete resets the MRU hint; a following get(None) hit must
+        still promote the None key (regression for the None-as-sentinel
+        collision)."""
+        cache: LRUCache = LRUCache(capacity=3)
+        cache.set(None, "n")
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.delete("b")   # hint was "b" — resets it
+        cache.get(None)     # must relink None to the MRU front
+        cache.set("c", 3)
+        cache.set("d", 4)   # one eviction: "a" is the true LRU
+        assert cache.contains(None)
+        assert not cache.contains("a")
+
+    def test_none_key_eviction_order(self):
+        cache: LRUCache = LRUCache(capacity=2)
+        cache.set(None, "n")
+        cache.set("a", 1)
+        cache.get(None)      # None becomes MRU
+        cache.set("b", 2)    # evicts "a"
+        assert cache.contains(None)
+        assert not cache.contains("a")
+
+
+# ---------------------------------------------------------------------------
+# ShardedLRUCache
+# ---------------------------------------------------------------------------
+
+class TestShardedLRUCache:
+    def test_set_get_delete_contains(self):
+        cache: ShardedLRUCache[str, int] = ShardedLRUCache(capacity=128, num_shards=4)
+        cache.set("k", 1)
+        assert cache.get("k") == 1
+        assert "k" in cache
+        assert cache.delete("k") is True
+        assert cache.get("k") is None
+
+    def test_capacity_split_across_shards(self):
+        cache = ShardedLRUCache(capacity=128, num_shards=4)
+        assert cache.capacity == 128
+        assert cache.num_shards == 4
+
+    def test_non_power_of_two_shards_raises(self):
+        with pytest.raises(ValueError, match="num_shards"):
+            ShardedLRUCache(capacity=100, num_shards=3)
+
+    def test_capacity_below_shard_count_raises(self):
+        with pytest.raises(ValueError, match="capacity"):
+            ShardedLRUCache(capacity=2, num_shards=4)
+
+    def test_auto_shard_derivation(self):
+        # Small caches keep one lock; large ones stripe up to 64 shards.
+        assert ShardedLRUCache(capacity=32).num_shards == 1
+        assert ShardedLRUCache(capacity=4096).num_shards == 64
+
+    def test_size_bounded_by_capacity(self):
+        cache: ShardedLRUCache[int, int] = ShardedLRUCache(capacity=64, num_shards=4)
+        for i in range(1000):
+            cache.set(i, i)
+        assert len(cache) <= 64
+
+    def test_stats_aggregated_across_shards(self):
+        cache: ShardedLRUCache[int, int] = ShardedLRUCache(capacity=128, num_shards=4)
+        for i in range(20):
+            cache.set(i, i)
+        for i in range(20):
+            cache.get(i)       # hits, spread over shards
+        cache.get("missing")   # one miss somewhere
+        s = cache.stats()
+        assert s.hits == 20
+        assert s.misses == 1
+
+    def test_reset_stats_clears_every_shard(self):
+        cache: ShardedLRUCache[int, int] = ShardedLRUCache(capacity=128, num_shards=4)
+        for i in range(20):
+            cache.set(i, i)
+            cache.get(i)
+        cache.reset_stats()
+        assert cache.stats().hits == 0
+
+    def test_ttl_expiry_through_shards(self):
+        cache: ShardedLRUCache[int, int] = ShardedLRUCache(capacity=128, num_shards=4)
+        for i in range(8):
+            cache.set(i, i, ttl=0.05)
+        time.sleep(0.1)
+        for i in range(8):
+            assert cache.get(i) is None
+
+    def test_clear_empties_all_shards(self):
+        cache: ShardedLRUCache[int, int] = ShardedLRUCache(capacity=128, num_shards=4)
+        for i in range(50):
+            cache.set(i, i)
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_concurrent_access_across_shards(self):
+        cache: ShardedLRUCache[int, int] = ShardedLRUCache(capacity=1024, num_shards=8)
+        errors = []
+
+        def worker(start: int) -> None:
+            try:
+                for i in range(start, start + 100):
+                    cache.set(i, i)
+                    assert cache.get(i) == i
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker, args=(i * 100,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert not errors
+
+    def test_async_set_and_get(self, event_loop):
+        async def _run():
+            cache: ShardedLRUCache[str, int] = ShardedLRUCache(capacity=128, num_shards=4)
+            await cache.aset("key", 99)
+            assert await cache.aget("key") == 99
+            assert await cache.aget("missing", -1) == -1
+
+        event_loop.run_until_complete(_run())
+
+    def test_repr_contains_shard_count(self):
+        cache = ShardedLRUCache(capacity=128, num_shards=4)
+        assert "num_shards=4" in repr(cache)